@@ -1,57 +1,23 @@
 """The Combivox Amica Web integration."""
 
+import asyncio
 import logging
-import voluptuous as vol
+import os
 from datetime import timedelta
+from operator import attrgetter
 from typing import Any, Dict, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform, CONF_IP_ADDRESS
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.typing import UNDEFINED
 
+from . import services
 from .base import CombivoxWebClient
-
-_LOGGER = logging.getLogger(__name__)
-
-
-class CannotConnect(Exception):
-    """Error to indicate we cannot connect."""
-
-
-class InvalidAuth(Exception):
-    """Error to indicate there is invalid auth."""
-
-
-async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Migrate old entry."""
-    _LOGGER.info("Migrating config entry from version %s", config_entry.version)
-
-    if config_entry.version < 1:
-        from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-
-        if CONF_SCAN_INTERVAL not in config_entry.options:
-            new_options = dict(config_entry.options)
-            new_options[CONF_SCAN_INTERVAL] = DEFAULT_SCAN_INTERVAL
-            _LOGGER.info("Adding scan_interval=%s to options", DEFAULT_SCAN_INTERVAL)
-
-            hass.config_entries.async_update_entry(
-                config_entry,
-                options=new_options,
-                version=1
-            )
-
-            _LOGGER.info("Migration completed: Please reload the integration to apply changes")
-        else:
-            hass.config_entries.async_update_entry(config_entry, version=1)
-
-    return True
-
-
 from .const import (
     DOMAIN,
-    DATA_COORDINATOR,
-    DATA_UPDATE_LISTENER,
-    DATA_CONFIG,
     CONF_IP_ADDRESS,
     CONF_PORT,
     CONF_CODE,
@@ -73,8 +39,46 @@ from .const import (
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
 )
+from .coordinator import CombivoxDataUpdateCoordinator, CombivoxOptionsSnapshot, CombivoxRuntimeData
+
+_LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+
+class CannotConnect(Exception):
+    """Error to indicate we cannot connect."""
+
+
+class InvalidAuth(Exception):
+    """Error to indicate there is invalid auth."""
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    """Migrate old entry."""
+    _LOGGER.debug("Migrating config entry from version %s", config_entry.version)
+
+    if config_entry.version >= 1:
+        return True
+
+    # Only rewrite options when scan_interval is missing, otherwise just bump the version
+    options_changed = CONF_SCAN_INTERVAL not in config_entry.options
+    new_options = UNDEFINED
+    if options_changed:
+        new_options = {**config_entry.options, CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL}
+        _LOGGER.debug("Adding scan_interval=%s to options", DEFAULT_SCAN_INTERVAL)
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options=new_options,
+        version=1
+    )
+
+    if options_changed:
+        _LOGGER.info("Migration completed: Please reload the integration to apply changes")
+
+    return True
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -84,22 +88,47 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
+# Cached config file path (relative to the HA config dir), formatted with ip and port
+_CONFIG_PATH_FMT = "combivox_web/config_{}_{}.json".format
+
+# Snapshot fields grouped by change type (used by _detect_changes)
+_AREAS_KEYS = attrgetter("areas_away", "areas_home", "areas_night", "areas_custom_bypass", "areas_disarm")
+_MACRO_KEYS = attrgetter("macro_away", "macro_home", "macro_night", "macro_custom_bypass", "macro_disarm")
+_ARM_MODE_KEYS = attrgetter("arm_mode_away", "arm_mode_home", "arm_mode_night", "arm_mode_custom_bypass")
+
+
+# Alarm panel updates applied by _apply_changes: (change flag, entity method, args builder, log label)
+_PANEL_STEPS = (
+    ("enable_bypass", "update_enable_bypass", lambda n: (n.enable_bypass,), "custom bypass feature"),
+    ("areas", "update_areas", lambda n: (
+        n.areas_away, n.areas_home, n.areas_night, n.areas_custom_bypass, n.areas_disarm,
+    ), "areas"),
+    ("macros", "update_macros", lambda n: (
+        n.macro_away, n.macro_home, n.macro_night, n.macro_custom_bypass, n.macro_disarm,
+    ), "macros"),
+    ("arm_modes", "update_arm_modes", lambda n: (
+        n.arm_mode_away, n.arm_mode_home, n.arm_mode_night, n.arm_mode_custom_bypass,
+    ), "arm modes"),
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Combivox Amica Web from a config entry."""
     _LOGGER.info("Setting up Combivox Amica Web integration")
 
     # Get configuration
-    ip_address = entry.data.get(CONF_IP_ADDRESS)
-    port = entry.data.get(CONF_PORT, 80)
-    code = entry.data.get(CONF_CODE)
+    data = entry.data
+    options = entry.options
+    ip_address = data.get(CONF_IP_ADDRESS)
+    port = data.get(CONF_PORT, 80)
+    code = data.get(CONF_CODE)
 
     if not ip_address or not code:
         _LOGGER.error("Missing required configuration: ip_address or code")
         return False
 
     # Create config file path
-    config_file_path = hass.config.path(f"combivox_web/config_{ip_address}_{port}.json")
+    config_file_path = hass.config.path(_CONFIG_PATH_FMT(ip_address, port))
 
     # Create client with reduced timeout for faster failure detection
     client = CombivoxWebClient(
@@ -117,42 +146,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.warning("Failed to connect to Combivox panel - will retry automatically")
         if not client.is_config_loaded():
             _LOGGER.error("No cached configuration available - cannot setup integration")
+            # Setup is aborted, so unload will never close the client's session
+            await client.close()
             return False
         _LOGGER.info("Using cached configuration - entities will be created but unavailable until connection succeeds")
     else:
         _LOGGER.info("Successfully connected to Combivox panel")
 
-    # Get polling interval - check options first, then data, then default
-    # This ensures we always have a value even on first setup
-    scan_interval = None
-    
-    # Priority 1: Check options (user may have changed it)
-    if CONF_SCAN_INTERVAL in entry.options:
-        scan_interval = entry.options.get(CONF_SCAN_INTERVAL)
-        _LOGGER.info("Found scan_interval in options: %s", scan_interval)
-    
-    # Priority 2: Check data (from previous setup or migration)
-    elif CONF_SCAN_INTERVAL in entry.data:
-        scan_interval = entry.data.get(CONF_SCAN_INTERVAL)
-        _LOGGER.info("Found scan_interval in data: %s", scan_interval)
-    
-    # Priority 3: Use default
-    else:
-        scan_interval = DEFAULT_SCAN_INTERVAL
-        _LOGGER.info("Using DEFAULT_SCAN_INTERVAL: %s", scan_interval)
-    
-    # Force cast to int in case it's stored as string
-    try:
-        scan_interval = int(scan_interval)
-    except (ValueError, TypeError) as e:
-        _LOGGER.warning("Invalid scan_interval value '%s' (%s), using default %s",
-                       scan_interval, e, DEFAULT_SCAN_INTERVAL)
-        scan_interval = DEFAULT_SCAN_INTERVAL
-
-    _LOGGER.info("Setting up coordinator with scan_interval: %d seconds", scan_interval)
+    # Get polling interval - options first (user may have changed it), then data
+    # (from previous setup or migration), then default (0 is not a valid interval)
+    scan_interval = (
+        options.get(CONF_SCAN_INTERVAL)
+        or data.get(CONF_SCAN_INTERVAL)
+        or DEFAULT_SCAN_INTERVAL
+    )
 
-    # Import coordinator
-    from .coordinator import CombivoxDataUpdateCoordinator
+    _LOGGER.debug("Setting up coordinator with scan_interval: %d seconds", scan_interval)
 
     # Create single coordinator with unified polling
     coordinator = CombivoxDataUpdateCoordinator(
@@ -161,136 +170,107 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         scan_interval=scan_interval
     )
 
-    # Preload data
+    # Load initial data before the platforms are set up, so entities start from the
+    # real panel state (raises ConfigEntryNotReady before anything is forwarded)
     await coordinator.async_config_entry_first_refresh()
 
-    # Register update listener for options changes
-    update_listener = entry.add_update_listener(options_update_listener)
+    # Register update listener for options changes (removed automatically on unload)
+    entry.async_on_unload(entry.add_update_listener(options_update_listener))
 
-    # Store coordinator and client
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        DATA_COORDINATOR: coordinator,
-        DATA_CONFIG: client,
-        DATA_UPDATE_LISTENER: update_listener,
-    }
+    # Store coordinator and client on the config entry
+    entry.runtime_data = CombivoxRuntimeData(
+        coordinator=coordinator,
+        client=client,
+        config_file_path=config_file_path,
+        options_fingerprint=_options_fingerprint(options),
+    )
 
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Setup services
-    from . import services
     await services.setup_services(hass)
 
     return True
 
 
-def _get_alarm_panel_entity(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Get alarm panel entity from hass.data.
+def _options_fingerprint(options) -> int:
+    """Compute a hash of the entry options (list values frozen to tuples).
+
+    Args:
+        options: Config entry options mapping
+
+    Returns:
+        Hash used to detect no-op options saves
+    """
+    return hash(tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in sorted(options.items())
+    ))
+
+
+def _runtime_data(config_entry: ConfigEntry) -> Optional[CombivoxRuntimeData]:
+    """Get the per-entry runtime data from the config entry.
 
     Args:
-        hass: Home Assistant instance
         config_entry: Configuration entry
 
     Returns:
-        Alarm panel entity or None
+        Entry runtime data or None if the entry is not set up
     """
-    return hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get("alarm_panel_entity")
+    return getattr(config_entry, "runtime_data", None)
 
 
-def _extract_new_config(config_entry: ConfigEntry) -> Dict[str, Any]:
+def _extract_new_config(config_entry: ConfigEntry) -> CombivoxOptionsSnapshot:
     """Extract new configuration from options.
 
     Args:
         config_entry: Configuration entry with updated options
 
     Returns:
-        Dict with all new configuration values
+        Snapshot with all new configuration values
     """
-    from .const import (
-        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL,
-        CONF_AREAS_AWAY, CONF_AREAS_HOME, CONF_AREAS_NIGHT, CONF_AREAS_CUSTOM_BYPASS, CONF_AREAS_DISARM,
-        CONF_MACRO_AWAY, CONF_MACRO_HOME, CONF_MACRO_NIGHT, CONF_MACRO_CUSTOM_BYPASS, CONF_MACRO_DISARM,
-        CONF_ARM_MODE_AWAY, CONF_ARM_MODE_HOME, CONF_ARM_MODE_NIGHT, CONF_ARM_MODE_CUSTOM_BYPASS,
+    opts = config_entry.options
+
+    return CombivoxOptionsSnapshot(
+        areas_away=tuple(opts.get(CONF_AREAS_AWAY, ())),
+        areas_home=tuple(opts.get(CONF_AREAS_HOME, ())),
+        areas_night=tuple(opts.get(CONF_AREAS_NIGHT, ())),
+        areas_custom_bypass=tuple(opts.get(CONF_AREAS_CUSTOM_BYPASS, ())),
+        areas_disarm=tuple(opts.get(CONF_AREAS_DISARM, ())),
+        macro_away=opts.get(CONF_MACRO_AWAY, ""),
+        macro_home=opts.get(CONF_MACRO_HOME, ""),
+        macro_night=opts.get(CONF_MACRO_NIGHT, ""),
+        macro_custom_bypass=opts.get(CONF_MACRO_CUSTOM_BYPASS, ""),
+        macro_disarm=opts.get(CONF_MACRO_DISARM, ""),
+        arm_mode_away=opts.get(CONF_ARM_MODE_AWAY, "normal"),
+        arm_mode_home=opts.get(CONF_ARM_MODE_HOME, "normal"),
+        arm_mode_night=opts.get(CONF_ARM_MODE_NIGHT, "normal"),
+        arm_mode_custom_bypass=opts.get(CONF_ARM_MODE_CUSTOM_BYPASS, "normal"),
+        enable_bypass=opts.get(CONF_ENABLE_CUSTOM_BYPASS, False),
+        # Already validated as int by the options flow schema
+        scan_interval=opts.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
     )
 
-    # Extract scan interval and convert to int
-    new_scan_interval_raw = config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    try:
-        new_scan_interval = int(new_scan_interval_raw)
-    except (ValueError, TypeError):
-        _LOGGER.warning("Invalid scan_interval in options: %s, using default", new_scan_interval_raw)
-        new_scan_interval = DEFAULT_SCAN_INTERVAL
-
-    return {
-        "areas_away": config_entry.options.get(CONF_AREAS_AWAY, []),
-        "areas_home": config_entry.options.get(CONF_AREAS_HOME, []),
-        "areas_night": config_entry.options.get(CONF_AREAS_NIGHT, []),
-        "areas_custom_bypass": config_entry.options.get(CONF_AREAS_CUSTOM_BYPASS, []),
-        "areas_disarm": config_entry.options.get(CONF_AREAS_DISARM, []),
-        "macro_away": config_entry.options.get(CONF_MACRO_AWAY, ""),
-        "macro_home": config_entry.options.get(CONF_MACRO_HOME, ""),
-        "macro_night": config_entry.options.get(CONF_MACRO_NIGHT, ""),
-        "macro_custom_bypass": config_entry.options.get(CONF_MACRO_CUSTOM_BYPASS, ""),
-        "macro_disarm": config_entry.options.get(CONF_MACRO_DISARM, ""),
-        "arm_mode_away": config_entry.options.get(CONF_ARM_MODE_AWAY, "normal"),
-        "arm_mode_home": config_entry.options.get(CONF_ARM_MODE_HOME, "normal"),
-        "arm_mode_night": config_entry.options.get(CONF_ARM_MODE_NIGHT, "normal"),
-        "arm_mode_custom_bypass": config_entry.options.get(CONF_ARM_MODE_CUSTOM_BYPASS, "normal"),
-        "scan_interval": new_scan_interval,
-        "enable_bypass": config_entry.options.get(CONF_ENABLE_CUSTOM_BYPASS, False),
-    }
-
 
-def _get_current_config(alarm_panel) -> Dict[str, Any]:
+def _get_current_config(alarm_panel) -> CombivoxOptionsSnapshot:
     """Get current configuration from alarm panel entity.
 
     Args:
         alarm_panel: Alarm panel entity (can be None)
 
     Returns:
-        Dict with all current configuration values
+        Snapshot with all current configuration values (scan_interval not set)
     """
     if not alarm_panel:
         # Fallback defaults if entity not found
-        return {
-            "areas_away": [],
-            "areas_home": [],
-            "areas_night": [],
-            "areas_custom_bypass": [],
-            "areas_disarm": [],
-            "macro_away": "",
-            "macro_home": "",
-            "macro_night": "",
-            "macro_custom_bypass": "",
-            "macro_disarm": "",
-            "arm_mode_away": "normal",
-            "arm_mode_home": "normal",
-            "arm_mode_night": "normal",
-            "arm_mode_custom_bypass": "normal",
-            "enable_bypass": False,
-        }
+        return CombivoxOptionsSnapshot()
 
-
-    return {
-        "areas_away": alarm_panel.areas_away or [],
-        "areas_home": alarm_panel.areas_home or [],
-        "areas_night": alarm_panel.areas_night or [],
-        "areas_custom_bypass": alarm_panel.areas_custom_bypass or [],
-        "areas_disarm": alarm_panel.areas_disarm or [],
-        "macro_away": alarm_panel.macro_away or "",
-        "macro_home": alarm_panel.macro_home or "",
-        "macro_night": alarm_panel.macro_night or "",
-        "macro_custom_bypass": alarm_panel.macro_custom_bypass or "",
-        "macro_disarm": alarm_panel.macro_disarm or "",
-        "arm_mode_away": alarm_panel.arm_mode_away,
-        "arm_mode_home": alarm_panel.arm_mode_home,
-        "arm_mode_night": alarm_panel.arm_mode_night,
-        "arm_mode_custom_bypass": alarm_panel.arm_mode_custom_bypass,
-        "enable_bypass": alarm_panel.enable_bypass,
-    }
+    # Entity caches its snapshot and only rebuilds it after an update_* call
+    return alarm_panel.config_snapshot
 
 
-def _detect_changes(new_config: Dict[str, Any], current_config: Dict[str, Any],
+def _detect_changes(new_config: CombivoxOptionsSnapshot, current_config: CombivoxOptionsSnapshot,
                    current_interval: Optional[int]) -> Dict[str, Any]:
     """Detect which configuration values changed.
 
@@ -302,38 +282,17 @@ def _detect_changes(new_config: Dict[str, Any], current_config: Dict[str, Any],
     Returns:
         Dict with boolean flags for each change type
     """
-    # Check areas
-    areas_changed = (
-        new_config.get("areas_away", []) != current_config.get("areas_away", []) or
-        new_config.get("areas_home", []) != current_config.get("areas_home", []) or
-        new_config.get("areas_night", []) != current_config.get("areas_night", []) or
-        new_config.get("areas_custom_bypass", []) != current_config.get("areas_custom_bypass", []) or
-        new_config.get("areas_disarm", []) != current_config.get("areas_disarm", [])
-    )
-
-    # Check macros
-    macros_changed = (
-        new_config["macro_away"] != current_config["macro_away"] or
-        new_config["macro_home"] != current_config["macro_home"] or
-        new_config["macro_night"] != current_config["macro_night"] or
-        new_config["macro_custom_bypass"] != current_config["macro_custom_bypass"] or
-        new_config["macro_disarm"] != current_config["macro_disarm"]
-    )
-
-    # Check arm modes
-    arm_modes_changed = (
-        new_config["arm_mode_away"] != current_config["arm_mode_away"] or
-        new_config["arm_mode_home"] != current_config["arm_mode_home"] or
-        new_config["arm_mode_night"] != current_config["arm_mode_night"] or
-        new_config["arm_mode_custom_bypass"] != current_config["arm_mode_custom_bypass"]
-    )
+    # Compare each group of fields as a single tuple
+    areas_changed = _AREAS_KEYS(new_config) != _AREAS_KEYS(current_config)
+    macros_changed = _MACRO_KEYS(new_config) != _MACRO_KEYS(current_config)
+    arm_modes_changed = _ARM_MODE_KEYS(new_config) != _ARM_MODE_KEYS(current_config)
 
     # Check scan interval
     scan_interval_changed = (current_interval is not None and
-                            current_interval != new_config["scan_interval"])
+                            current_interval != new_config.scan_interval)
 
     # Check enable bypass checkbox
-    enable_bypass_changed = new_config["enable_bypass"] != current_config["enable_bypass"]
+    enable_bypass_changed = new_config.enable_bypass != current_config.enable_bypass
 
     return {
         "areas": areas_changed,
@@ -344,124 +303,70 @@ def _detect_changes(new_config: Dict[str, Any], current_config: Dict[str, Any],
     }
 
 
-async def _apply_changes(hass: HomeAssistant, config_entry: ConfigEntry,
-                        changes: Dict[str, Any], new_config: Dict[str, Any],
+async def _apply_changes(alarm_panel, coordinator: CombivoxDataUpdateCoordinator,
+                        changes: Dict[str, Any], new_config: CombivoxOptionsSnapshot,
                         current_interval: Optional[int]) -> None:
     """Apply detected configuration changes.
 
     Args:
-        hass: Home Assistant instance
-        config_entry: Configuration entry
+        alarm_panel: Alarm panel entity (can be None)
+        coordinator: Data update coordinator
         changes: Dict with boolean flags for each change type
         new_config: New configuration values
         current_interval: Current scan interval for logging
     """
-    alarm_panel = _get_alarm_panel_entity(hass, config_entry)
-    coordinator = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get(DATA_COORDINATOR)
-
-    if changes["enable_bypass"]:
-        _LOGGER.info("Custom bypass option changed - updating alarm panel entity features to: %s", new_config["enable_bypass"])
-        try:
-            if alarm_panel:
-                alarm_panel.update_enable_bypass(new_config["enable_bypass"])
-                _LOGGER.info("Alarm panel custom bypass feature updated successfully")
-            else:
-                _LOGGER.warning("Alarm panel entity not found, cannot update custom bypass feature")
-        except Exception as e:
-            _LOGGER.error("Error updating alarm panel entity custom bypass feature: %s", e)
-
-    # Update areas dynamically (no reload needed)
-    if changes["areas"]:
-        _LOGGER.info("Areas configuration changed - updating alarm panel entity")
-        _LOGGER.info("Areas to update - away: %s, home: %s, night: %s, custom_bypass: %s, disarm: %s",
-                    new_config.get("areas_away", []),
-                    new_config.get("areas_home", []),
-                    new_config.get("areas_night", []),
-                    new_config.get("areas_custom_bypass", []),
-                    new_config.get("areas_disarm", []))
-        try:
-            if alarm_panel:
-                alarm_panel.update_areas(
-                    new_config.get("areas_away", []),
-                    new_config.get("areas_home", []),
-                    new_config.get("areas_night", []),
-                    new_config.get("areas_custom_bypass", []),
-                    new_config.get("areas_disarm", [])
-                )
-                _LOGGER.info("Alarm panel areas updated successfully")
-            else:
-                _LOGGER.warning("Alarm panel entity not found, cannot update areas")
-        except Exception as e:
-            _LOGGER.error("Error updating alarm panel entity areas: %s", e)
-    else:
-        _LOGGER.debug("Areas configuration NOT changed - skipping update")
-
-    # Update macros dynamically (no reload needed)
-    if changes["macros"]:
-        _LOGGER.debug("Macros configuration changed - updating alarm panel entity")
+    # Update alarm panel entity dynamically (no reload needed)
+    for flag, method, args_fn, label in _PANEL_STEPS:
+        if not changes[flag]:
+            _LOGGER.debug("Alarm panel %s NOT changed - skipping update", label)
+            continue
+        if not alarm_panel:
+            _LOGGER.warning("Alarm panel entity not found, cannot update %s", label)
+            continue
+        _LOGGER.debug("Alarm panel %s changed - updating alarm panel entity", label)
         try:
-            if alarm_panel:
-                alarm_panel.update_macros(
-                    new_config["macro_away"],
-                    new_config["macro_home"],
-                    new_config["macro_night"],
-                    new_config["macro_custom_bypass"],
-                    new_config["macro_disarm"]
-                )
-                _LOGGER.debug("Alarm panel macros updated successfully")
-            else:
-                _LOGGER.warning("Alarm panel entity not found, cannot update macros")
-        except Exception as e:
-            _LOGGER.error("Error updating alarm panel entity macros: %s", e)
-
-    # Update arm modes dynamically (no reload needed)
-    if changes["arm_modes"]:
-        _LOGGER.debug("Arm modes configuration changed - updating alarm panel entity")
-        try:
-            if alarm_panel:
-                alarm_panel.update_arm_modes(
-                    new_config["arm_mode_away"],
-                    new_config["arm_mode_home"],
-                    new_config["arm_mode_night"],
-                    new_config["arm_mode_custom_bypass"]
-                )
-                _LOGGER.debug("Alarm panel arm modes updated successfully")
-            else:
-                _LOGGER.warning("Alarm panel entity not found, cannot update arm modes")
-        except Exception as e:
-            _LOGGER.error("Error updating alarm panel entity arm modes: %s", e)
+            getattr(alarm_panel, method)(*args_fn(new_config))
+            _LOGGER.debug("Alarm panel %s updated successfully", label)
+        except Exception:
+            _LOGGER.exception("Error updating alarm panel entity %s", label)
 
     # Update scan_interval dynamically (no reload needed)
     if changes["scan_interval"] and coordinator:
         _LOGGER.debug("Scan interval CHANGED from %s to %s seconds - calling update_scan_interval()",
-                    current_interval, new_config["scan_interval"])
+                    current_interval, new_config.scan_interval)
 
         try:
-            await coordinator.update_scan_interval(new_config["scan_interval"])
+            await coordinator.update_scan_interval(new_config.scan_interval)
             _LOGGER.debug("Coordinator scan interval updated successfully to %s seconds",
-                         new_config["scan_interval"])
-        except Exception as e:
-            _LOGGER.error("Error updating scan interval: %s", e)
-            import traceback
-            traceback.print_exc()
+                         new_config.scan_interval)
+        except Exception:
+            _LOGGER.exception("Error updating scan interval")
     else:
         _LOGGER.debug("Scan interval NOT changed (%s == %s), skipping update",
-                    current_interval, new_config["scan_interval"])
+                    current_interval, new_config.scan_interval)
 
 
 async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
-    # Get coordinator (required for scan interval updates)
-    coordinator = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get(DATA_COORDINATOR)
+    # Get coordinator (required for scan interval updates) and alarm panel entity
+    runtime_data = _runtime_data(config_entry)
+    coordinator = runtime_data.coordinator if runtime_data else None
     if not coordinator:
-        _LOGGER.error("Coordinator not found in hass.data!")
+        _LOGGER.error("Coordinator not found in entry runtime data!")
+        return
+    alarm_panel = runtime_data.alarm_panel_entity
+
+    # Skip change detection entirely when options were saved without edits
+    fingerprint = _options_fingerprint(config_entry.options)
+    if fingerprint == runtime_data.options_fingerprint:
+        _LOGGER.debug("Options unchanged, skipping update")
         return
+    runtime_data.options_fingerprint = fingerprint
 
     # Extract new configuration from options
     new_config = _extract_new_config(config_entry)
 
     # Get current configuration from alarm panel entity
-    alarm_panel = _get_alarm_panel_entity(hass, config_entry)
     current_config = _get_current_config(alarm_panel)
 
     # Get current scan interval from coordinator
@@ -471,45 +376,51 @@ async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry
     changes = _detect_changes(new_config, current_config, current_interval)
 
     # Apply all detected changes
-    await _apply_changes(hass, config_entry, changes, new_config, current_interval)
+    await _apply_changes(alarm_panel, coordinator, changes, new_config, current_interval)
+
+
+def _delete_config_file(config_file_path: str) -> bool:
+    """Delete the cached config file (blocking, run in executor).
+
+    Args:
+        config_file_path: Path of the cached config file
+
+    Returns:
+        True if the file was deleted, False if it did not exist
+    """
+    try:
+        os.remove(config_file_path)
+    except FileNotFoundError:
+        return False
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     _LOGGER.info("Unloading Combivox Amica Web integration")
 
-    # Shutdown coordinator first (stop polling)
-    try:
-        coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-        await coordinator.async_shutdown()
-        _LOGGER.info("Coordinator shutdown complete")
-    except Exception as e:
-        _LOGGER.error("Error shutting down coordinator: %s", e)
-
-    # Close client (cleanup HTTP session and cookies)
-    try:
-        client = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
-        config_file_path = client.get_config_file_path()
-        await client.close()
-        _LOGGER.info("Client closed successfully")
-    except Exception as e:
-        _LOGGER.error("Error closing client: %s", e)
-        config_file_path = None
+    # Config file path cached at setup time
+    runtime_data = _runtime_data(entry)
+    config_file_path = runtime_data.config_file_path if runtime_data else None
+
+    # Shutdown coordinator (stop polling) and close client (cleanup HTTP session
+    # and cookies) concurrently - they are independent of each other
+    if runtime_data:
+        results = await asyncio.gather(
+            runtime_data.coordinator.async_shutdown(),
+            runtime_data.client.close(),
+            return_exceptions=True,
+        )
+        for label, result in zip(("shutting down coordinator", "closing client"), results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error %s: %s", label, result)
+        _LOGGER.debug("Coordinator shutdown and client close complete")
 
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Remove update listener
-        hass.data[DOMAIN][entry.entry_id][DATA_UPDATE_LISTENER]()
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-        # Cleanup if no more entries
-        if not hass.data.get(DOMAIN):
-            del hass.data[DOMAIN]
-
         # Clean up entity registry - remove all entities for this integration
-        from homeassistant.helpers import entity_registry as er
         entity_reg = er.async_get(hass)
         entity_reg.async_clear_config_entry(entry)
 
@@ -517,10 +428,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         # Delete cached config file
         if config_file_path:
-            import os
             try:
-                if os.path.exists(config_file_path):
-                    os.remove(config_file_path)
+                deleted = await hass.async_add_executor_job(_delete_config_file, config_file_path)
+                if deleted:
                     _LOGGER.info("Deleted cached config file: %s", config_file_path)
                 else:
                     _LOGGER.debug("Config file not found (already deleted): %s", config_file_path)
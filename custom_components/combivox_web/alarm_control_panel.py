@@ -2,7 +2,7 @@
 
 import logging
 import asyncio
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
@@ -14,11 +14,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .base import CombivoxWebClient
+from .base import CombivoxWebClient, _areas_bitmask
 from .const import (
-    DOMAIN,
-    DATA_COORDINATOR,
-    DATA_CONFIG,
     CONF_AREAS_AWAY,
     CONF_AREAS_HOME,
     CONF_AREAS_NIGHT,
@@ -36,10 +33,36 @@ from .const import (
     CONF_MACRO_DISARM,
     ALARM_HEX_TO_HA_STATE,
 )
-from .coordinator import CombivoxDataUpdateCoordinator
+from .coordinator import CombivoxDataUpdateCoordinator, CombivoxOptionsSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+# Alarm panel constructor kwargs read from entry options: (kwarg name, option key, default)
+_OPTION_SPEC = (
+    ("enable_bypass", CONF_ENABLE_CUSTOM_BYPASS, False),
+    ("areas_away", CONF_AREAS_AWAY, ()),
+    ("areas_home", CONF_AREAS_HOME, ()),
+    ("areas_night", CONF_AREAS_NIGHT, ()),
+    ("areas_custom_bypass", CONF_AREAS_CUSTOM_BYPASS, ()),
+    ("areas_disarm", CONF_AREAS_DISARM, ()),
+    ("macro_away", CONF_MACRO_AWAY, ""),
+    ("macro_home", CONF_MACRO_HOME, ""),
+    ("macro_night", CONF_MACRO_NIGHT, ""),
+    ("macro_custom_bypass", CONF_MACRO_CUSTOM_BYPASS, ""),
+    ("macro_disarm", CONF_MACRO_DISARM, ""),
+    ("arm_mode_away", CONF_ARM_MODE_AWAY, "normal"),
+    ("arm_mode_home", CONF_ARM_MODE_HOME, "normal"),
+    ("arm_mode_night", CONF_ARM_MODE_NIGHT, "normal"),
+    ("arm_mode_custom_bypass", CONF_ARM_MODE_CUSTOM_BYPASS, "normal"),
+)
+_AREA_OPTION_NAMES = ("areas_away", "areas_home", "areas_night", "areas_custom_bypass", "areas_disarm")
+
+# Seconds to wait for a command to take effect before refreshing the state
+_COMMAND_SETTLE_DELAY = 2
+
+# Shared fallback when the coordinator has no data yet (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,63 +73,35 @@ async def async_setup_entry(
     _LOGGER.info("Setting up alarm control panel")
 
     # Get coordinator and client
-    coordinator: CombivoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    client: CombivoxWebClient = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+    coordinator: CombivoxDataUpdateCoordinator = entry.runtime_data.coordinator
+    client: CombivoxWebClient = entry.runtime_data.client
 
     # Get device info for HA
     device_info = client.get_device_info_for_ha()
 
-    # Get custom bypass enabling status
-    enable_bypass = entry.options.get(CONF_ENABLE_CUSTOM_BYPASS, False)
-
-    # Get area mappings from options (not data!)
-    areas_away = entry.options.get(CONF_AREAS_AWAY, [])
-    areas_home = entry.options.get(CONF_AREAS_HOME, [])
-    areas_night = entry.options.get(CONF_AREAS_NIGHT, [])
-    areas_custom_bypass = entry.options.get(CONF_AREAS_CUSTOM_BYPASS, [])
-    areas_disarm = entry.options.get(CONF_AREAS_DISARM, [])
-
-    # Get macro mappings from options
-    macro_away = entry.options.get(CONF_MACRO_AWAY, "")
-    macro_home = entry.options.get(CONF_MACRO_HOME, "")
-    macro_night = entry.options.get(CONF_MACRO_NIGHT, "")
-    macro_custom_bypass = entry.options.get(CONF_MACRO_CUSTOM_BYPASS, "")
-    macro_disarm = entry.options.get(CONF_MACRO_DISARM, "")
-
-    # Get arm mode mappings from options
-    arm_mode_away = entry.options.get(CONF_ARM_MODE_AWAY, "normal")
-    arm_mode_home = entry.options.get(CONF_ARM_MODE_HOME, "normal")
-    arm_mode_night = entry.options.get(CONF_ARM_MODE_NIGHT, "normal")
-    arm_mode_custom_bypass = entry.options.get(CONF_ARM_MODE_CUSTOM_BYPASS, "normal")
+    # Read all panel settings from options (not data!) in one pass
+    options = entry.options
+    panel_kwargs = {name: options.get(key, default) for name, key, default in _OPTION_SPEC}
+
+    # Area lists are read-only after config
+    for name in _AREA_OPTION_NAMES:
+        panel_kwargs[name] = tuple(panel_kwargs[name])
 
     _LOGGER.info("Alarm panel loading - arm modes: away=%s, home=%s, night=%s, custom_bypass=%s", 
-                arm_mode_away, arm_mode_home, arm_mode_night, arm_mode_custom_bypass)
+                panel_kwargs["arm_mode_away"], panel_kwargs["arm_mode_home"],
+                panel_kwargs["arm_mode_night"], panel_kwargs["arm_mode_custom_bypass"])
 
     entity = CombivoxAlarmControlPanel(
         client=client,
         coordinator=coordinator,
         device_info=device_info,
-        areas_away=areas_away,
-        areas_home=areas_home,
-        areas_night=areas_night,
-        areas_custom_bypass=areas_custom_bypass,
-        areas_disarm=areas_disarm,
-        macro_away=macro_away,
-        macro_home=macro_home,
-        macro_night=macro_night,
-        enable_bypass=enable_bypass,
-        macro_custom_bypass=macro_custom_bypass,
-        macro_disarm=macro_disarm,
-        arm_mode_away=arm_mode_away,
-        arm_mode_home=arm_mode_home,
-        arm_mode_night=arm_mode_night,
-        arm_mode_custom_bypass=arm_mode_custom_bypass,
+        **panel_kwargs,
     )
 
     async_add_entities([entity], update_before_add=True)
 
     # Store entity reference for dynamic updates
-    hass.data[DOMAIN][entry.entry_id]["alarm_panel_entity"] = entity
+    entry.runtime_data.alarm_panel_entity = entity
 
     _LOGGER.info("Alarm control panel added")
 
@@ -119,11 +114,11 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         client: CombivoxWebClient,
         coordinator: CombivoxDataUpdateCoordinator,
         device_info: Dict[str, Any],
-        areas_away: List[int],
-        areas_home: List[int],
-        areas_night: List[int],
-        areas_custom_bypass: List[int],
-        areas_disarm: List[int],
+        areas_away: Sequence[int],
+        areas_home: Sequence[int],
+        areas_night: Sequence[int],
+        areas_custom_bypass: Sequence[int],
+        areas_disarm: Sequence[int],
         macro_away: str = "",
         macro_home: str = "",
         macro_night: str = "",
@@ -143,12 +138,13 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         self.enable_bypass = enable_bypass
 
         # Store area mappings for each arm mode (NO DEFAULTS - use exactly what's configured)
-        # Empty list = no areas configured for this mode
-        self.areas_away = areas_away if areas_away else []
-        self.areas_home = areas_home if areas_home else []
-        self.areas_night = areas_night if areas_night else []
-        self.areas_disarm = areas_disarm if areas_disarm else []
-        self.areas_custom_bypass = areas_custom_bypass if areas_custom_bypass else []
+        # Empty tuple = no areas configured for this mode (read-only after config)
+        self.areas_away = tuple(areas_away) if areas_away else ()
+        self.areas_home = tuple(areas_home) if areas_home else ()
+        self.areas_night = tuple(areas_night) if areas_night else ()
+        self.areas_disarm = tuple(areas_disarm) if areas_disarm else ()
+        self.areas_custom_bypass = tuple(areas_custom_bypass) if areas_custom_bypass else ()
+        self._refresh_area_masks()
 
         # Store macro mappings for each arm/disarm action
         self.macro_away = macro_away
@@ -179,6 +175,15 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         # Do not require code for arming
         self._attr_code_arm_required = False 
 
+        # Cached options snapshot, rebuilt lazily after an update_* call
+        self._config_snapshot: Optional[CombivoxOptionsSnapshot] = None
+
+        # Signature of the last coordinator data written to HA (skip identical polls)
+        self._last_written: Optional[Tuple] = None
+
+        # Availability is cached here and refreshed on coordinator updates
+        self._attr_available = not coordinator._panel_unavailable
+
         _LOGGER.debug("Alarm panel initialized - arm modes: away=%s, home=%s, night=%s, custom_bypass=%s",
                      self.arm_mode_away, self.arm_mode_home, self.arm_mode_night, self.arm_mode_custom_bypass)
 
@@ -192,16 +197,41 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        data = self.coordinator.data or _EMPTY
+        self._attr_available = not self.coordinator._panel_unavailable
+        signature = (
+            data.get("alarm_hex"),
+            tuple(data.get("armed_areas") or ()),
+            data.get("status_hex"),
+            data.get("alarm_state"),
+            self._attr_available,
+        )
+
+        # Nothing relevant changed since the last write
+        if signature == self._last_written:
+            return
+
+        self._last_written = signature
         self.async_write_ha_state()
 
-    def update_areas(self, areas_away: List[int], areas_home: List[int], areas_night: List[int], areas_custom_bypass: List[int], areas_disarm: List[int]) -> None:
+    def _refresh_area_masks(self) -> None:
+        """Rebuild the away/home/night area bitmasks used by _determine_current_mode."""
+        self._mask_away = _areas_bitmask(self.areas_away)
+        self._mask_home = _areas_bitmask(self.areas_home)
+        self._mask_night = _areas_bitmask(self.areas_night)
+
+    def update_areas(self, areas_away: Sequence[int], areas_home: Sequence[int], areas_night: Sequence[int], areas_custom_bypass: Sequence[int], areas_disarm: Sequence[int]) -> None:
         """Update the area mappings dynamically."""
         # NO DEFAULTS - use exactly what's configured
-        self.areas_away = areas_away if areas_away else []
-        self.areas_home = areas_home if areas_home else []
-        self.areas_night = areas_night if areas_night else []
-        self.areas_custom_bypass = areas_custom_bypass if areas_custom_bypass else []
-        self.areas_disarm = areas_disarm if areas_disarm else []
+        self.areas_away = tuple(areas_away) if areas_away else ()
+        self.areas_home = tuple(areas_home) if areas_home else ()
+        self.areas_night = tuple(areas_night) if areas_night else ()
+        self.areas_custom_bypass = tuple(areas_custom_bypass) if areas_custom_bypass else ()
+        self.areas_disarm = tuple(areas_disarm) if areas_disarm else ()
+        self._refresh_area_masks()
+        self._config_snapshot = None
+        # Mode detection changed: write the state on the next poll even if the panel bytes did not
+        self._last_written = None
         _LOGGER.info("Alarm panel areas UPDATED - away: %s, home: %s, night: %s, custom_bypass: %s, disarm: %s",
                      self.areas_away or "(none)", self.areas_home or "(none)",
                      self.areas_night or "(none)", self.areas_custom_bypass or "(none)", self.areas_disarm or "(none)")
@@ -213,9 +243,10 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         self.macro_night = macro_night
         self.macro_custom_bypass = macro_custom_bypass
         self.macro_disarm = macro_disarm
+        self._config_snapshot = None
         _LOGGER.debug("Alarm panel macros updated - away: %s, home: %s, night: %s, custom_bypass: %s, disarm: %s",
-                     self.macro_away or "(none)", self.macro_home or "(none)",
-                     self.macro_night or "(none)", self.macro_custom_bypass or "(none)", self.macro_disarm or "(none)")
+                      self.macro_away or "(none)", self.macro_home or "(none)",
+                      self.macro_night or "(none)", self.macro_custom_bypass or "(none)", self.macro_disarm or "(none)")
 
     def update_arm_modes(self, arm_mode_away: str, arm_mode_home: str, arm_mode_night: str, arm_mode_custom_bypass: str) -> None:
         """Update the arm mode configurations dynamically."""
@@ -223,12 +254,16 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         self.arm_mode_home = arm_mode_home
         self.arm_mode_night = arm_mode_night
         self.arm_mode_custom_bypass = arm_mode_custom_bypass
-        _LOGGER.debug("Alarm panel arm modes updated - away: %s, home: %s, night: %s, night: %s, custom_bypass: %s",
-                     self.arm_mode_away, self.arm_mode_home, self.arm_mode_night, self.arm_mode_custom_bypass)
+        self._config_snapshot = None
+        # arm_mode_* attributes changed: write the state on the next poll
+        self._last_written = None
+        _LOGGER.debug("Alarm panel arm modes updated - away: %s, home: %s, night: %s, custom_bypass: %s",
+                      self.arm_mode_away, self.arm_mode_home, self.arm_mode_night, self.arm_mode_custom_bypass)
 
     def update_enable_bypass(self, enable_bypass: bool) -> None:
         """Update custom bypass enabling status."""
         self.enable_bypass = enable_bypass
+        self._config_snapshot = None
         if enable_bypass:
             # Add features
             self._attr_supported_features |= AlarmControlPanelEntityFeature.ARM_CUSTOM_BYPASS
@@ -239,18 +274,44 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         # Force Home Assistant to redraw entity UI
         self.async_write_ha_state()
 
+    @property
+    def config_snapshot(self) -> CombivoxOptionsSnapshot:
+        """Return the current options as a snapshot (cached until an update_* call)."""
+        if self._config_snapshot is None:
+            self._config_snapshot = CombivoxOptionsSnapshot(
+                areas_away=self.areas_away,
+                areas_home=self.areas_home,
+                areas_night=self.areas_night,
+                areas_custom_bypass=self.areas_custom_bypass,
+                areas_disarm=self.areas_disarm,
+                macro_away=self.macro_away or "",
+                macro_home=self.macro_home or "",
+                macro_night=self.macro_night or "",
+                macro_custom_bypass=self.macro_custom_bypass or "",
+                macro_disarm=self.macro_disarm or "",
+                arm_mode_away=self.arm_mode_away,
+                arm_mode_home=self.arm_mode_home,
+                arm_mode_night=self.arm_mode_night,
+                arm_mode_custom_bypass=self.arm_mode_custom_bypass,
+                enable_bypass=self.enable_bypass,
+            )
+        return self._config_snapshot
+
     @property
     def state(self) -> str:
         """Return the state of the alarm."""
+        data = self.coordinator.data or _EMPTY
+
         # First check alarm state (triggered/pending/arming)
-        alarm_hex = (self.coordinator.data or {}).get("alarm_hex", "")
+        alarm_hex = data.get("alarm_hex", "")
 
         # Check priority alarm states from hex mapping
-        if alarm_hex in ALARM_HEX_TO_HA_STATE:
-            return ALARM_HEX_TO_HA_STATE[alarm_hex]
+        mapped = ALARM_HEX_TO_HA_STATE.get(alarm_hex)
+        if mapped is not None:
+            return mapped
 
         # Determine mode from armed areas
-        mode = self._determine_current_mode()
+        mode = self._determine_current_mode(data.get("armed_areas", ()))
 
         # If no area armed → disarmed
         if mode == "unknown":
@@ -262,14 +323,15 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
-        armed_areas = (self.coordinator.data or {}).get("armed_areas", [])
-        current_mode = self._determine_current_mode()
+        data = self.coordinator.data or _EMPTY
+        armed_areas = data.get("armed_areas", [])
+        current_mode = self._determine_current_mode(armed_areas)
 
         attrs = {
             "armed_areas": armed_areas,
-            "status_hex": (self.coordinator.data or {}).get("status_hex", ""),
-            "alarm_hex": (self.coordinator.data or {}).get("alarm_hex", ""),
-            "alarm_state": (self.coordinator.data or {}).get("alarm_state", ""),
+            "status_hex": data.get("status_hex", ""),
+            "alarm_hex": data.get("alarm_hex", ""),
+            "alarm_state": data.get("alarm_state", ""),
             "areas_away_mode": self.areas_away,
             "areas_home_mode": self.areas_home,
             "areas_night_mode": self.areas_night,
@@ -285,27 +347,33 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return not self.coordinator._panel_unavailable
+        """Return if entity is available (cached by _handle_coordinator_update)."""
+        return self._attr_available
 
-    def _determine_current_mode(self) -> str:
+    def _determine_current_mode(self, armed_areas: Optional[List[int]] = None) -> str:
         """Determine current mode from armed areas.
 
+        Args:
+            armed_areas: Armed areas already read from coordinator data
+                (read from the coordinator when omitted)
+
         Returns:
             Mode string: "away", "home", "night", or "custom_bypass"
         """
-        armed_areas = (self.coordinator.data or {}).get("armed_areas", [])
+        if armed_areas is None:
+            armed_areas = (self.coordinator.data or _EMPTY).get("armed_areas", ())
 
         # If no area armed → no mode
         if not armed_areas:
             return "unknown"
 
         # Compare with configuration to determine mode
-        if set(armed_areas) == set(self.areas_away):
+        armed_mask = _areas_bitmask(armed_areas)
+        if armed_mask == self._mask_away:
             return "away"
-        elif set(armed_areas) == set(self.areas_home):
+        elif armed_mask == self._mask_home:
             return "home"
-        elif set(armed_areas) == set(self.areas_night):
+        elif armed_mask == self._mask_night:
             return "night"
         else:
             # Non-standard configuration
@@ -320,15 +388,8 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             # Convert macro_id to int
             macro_id_int = int(macro_id)
 
-            # Get macros config from client
-            macros_config = self.client.get_macros_config()
-
             # Find macro name for logging
-            macro_name = "Unknown"
-            for macro in macros_config:
-                if macro.get("macro_id") == macro_id_int:
-                    macro_name = macro.get("macro_name", "Unknown")
-                    break
+            macro_name = self.client.get_macro_name(macro_id_int)
 
             _LOGGER.info("Executing macro %s: %s", macro_id, macro_name)
 
@@ -346,7 +407,7 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             _LOGGER.error("Error executing macro %s: %s", macro_id, e)
             return False
 
-    def _determine_arm_strategy(self, macro: str, areas: List[int], mode: str) -> Dict[str, Any]:
+    def _determine_arm_strategy(self, macro: str, areas: Sequence[int], mode: str) -> Dict[str, Any]:
         """Determine arm strategy based on macro/areas configuration.
 
         Args:
@@ -386,17 +447,26 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             _LOGGER.info("Arm %s - using scenario (macro): %s", mode, macro)
             success = await self._execute_macro_if_configured(macro)
 
-        if success:
-            # Wait for command to take effect
-            await asyncio.sleep(2)
-            # Refresh coordinator to get new state
-            await self.coordinator.async_refresh()
-        else:
-            _LOGGER.error("Failed to arm %s", mode)
-
+        await self._apply_and_refresh(success, f"arm {mode}")
         return success
 
-    async def _arm_with_mode(self, mode: str, areas: List[int], macro_id: str, arm_mode: str) -> None:
+    async def _apply_and_refresh(self, success: bool, action: str) -> None:
+        """Refresh state after a command, or log its failure.
+
+        Args:
+            success: Whether the command was accepted by the panel
+            action: Action description for logging (e.g. "arm away", "disarm")
+        """
+        if not success:
+            _LOGGER.error("Failed to %s", action)
+            return
+
+        # Wait for command to take effect
+        await asyncio.sleep(_COMMAND_SETTLE_DELAY)
+        # Refresh coordinator to get new state
+        await self.coordinator.async_refresh()
+
+    async def _arm_with_mode(self, mode: str, areas: Sequence[int], macro_id: str, arm_mode: str) -> None:
         """Generic arm method with macro/areas priority logic.
 
         Args:
@@ -406,7 +476,7 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             arm_mode: Arm mode type (normal/immediate/forced)
         """
         _LOGGER.debug("Arm %s - macro_%s='%s', areas_%s=%s, arm_mode=%s",
-                     mode, mode, macro_id, mode, areas, arm_mode)
+                      mode, mode, macro_id, mode, areas, arm_mode)
 
         # Determine strategy (areas vs macro)
         strategy = self._determine_arm_strategy(macro_id, areas, mode)
@@ -450,7 +520,7 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
         """Send disarm command."""
         _LOGGER.debug("Disarm called - macro_disarm='%s', areas_disarm=%s (type: %s)",
-                     self.macro_disarm, self.areas_disarm, type(self.areas_disarm))
+                      self.macro_disarm, self.areas_disarm, type(self.areas_disarm))
 
         # Use same strategy as arm: macro priority, then areas
         if self.macro_disarm and self.areas_disarm:
@@ -467,15 +537,8 @@ class CombivoxAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             success = await self.client.disarm_areas(self.areas_disarm)
         else:
             # Neither macro nor areas configured, disarm all areas as fallback
-            areas_config = self.client.get_areas_config()
-            all_areas = [area["area_id"] for area in areas_config] if areas_config else list(range(1, 9))
+            all_areas = self.client.get_all_area_ids()
             _LOGGER.info("Disarm all areas (no areas configured): %s", all_areas)
             success = await self.client.disarm_areas(all_areas)
 
-        if success:
-            # Wait for command to take effect
-            await asyncio.sleep(2)
-            # Refresh coordinator to get new state
-            await self.coordinator.async_refresh()
-        else:
-            _LOGGER.error("Failed to disarm")
+        await self._apply_and_refresh(success, "disarm")
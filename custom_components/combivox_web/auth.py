@@ -1,9 +1,9 @@
 """Authentication module for Combivox Amica Web."""
 
-import base64
 import logging
 import random
 import asyncio
+from binascii import b2a_base64
 from typing import Optional, Tuple
 
 import aiohttp
@@ -12,6 +12,27 @@ from .const import PERMMANUAL_LOGIN, PERMMANUAL_COMMAND, LOGIN_URL, LOGIN2_URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Delays (seconds) before each login2.cgi probe; stop as soon as a cookie is returned
+_LOGIN2_RETRY_DELAYS = (0.2, 0.5, 1.0, 1.5, 2.0, 3.0)
+
+# Upper bound (seconds) for opening the TCP connection, within the total request timeout
+_CONNECT_TIMEOUT = 5
+
+# Pooled connections to the panel (the only host this session talks to); above the
+# client's request limiter so a slot is always free for login
+_CONNECTOR_LIMIT = 4
+
+# Seconds an idle pooled socket is kept open: longer than any scan interval or retry
+# backoff, so consecutive polls reuse the connection instead of reconnecting
+_KEEPALIVE_TIMEOUT = 75
+
+# Base sequence shuffled into PERMGEN for every generated password
+_PERM_BASE = (1, 2, 3, 4, 5, 6, 7, 8)
+
+# Zero-based offsets of the fixed permutations (computed once at import)
+_PERMMANUAL_LOGIN_IDX = tuple(t - 1 for t in PERMMANUAL_LOGIN)
+_PERMMANUAL_COMMAND_IDX = tuple(t - 1 for t in PERMMANUAL_COMMAND)
+
 
 class CombivoxAuth:
     """Manage authentication with Combivox Amica."""
@@ -24,15 +45,20 @@ class CombivoxAuth:
             ip_address: Panel IP address
             code: User code for authentication
             port: Panel HTTP port
-            timeout: Timeout for HTTP requests
+            timeout: Timeout for HTTP requests (seconds)
         """
         self.ip_address = ip_address
         self.code = code
         self.port = port
-        self.timeout = timeout
+        # Built once and passed to every request (a dead panel fails on connect, not on total)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=min(_CONNECT_TIMEOUT, timeout))
         self.base_url = f"http://{ip_address}:{port}"
-        self._cookie: Optional[str] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Session cookie and HTTP session, read directly on the request hot paths
+        self.cookie: Optional[str] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Serializes logins: each one clears the cookie jar, so two concurrent
+        # logins would wipe each other's cookie
+        self._login_lock = asyncio.Lock()
 
     def _generate_password(self, username: str = "admin", permmanual=None) -> Tuple[str, str]:
         """
@@ -49,11 +75,16 @@ class CombivoxAuth:
         if permmanual is None:
             if username == "combivox":
                 permmanual = PERMMANUAL_COMMAND
+                permmanual_idx = _PERMMANUAL_COMMAND_IDX
             else:
                 permmanual = PERMMANUAL_LOGIN
+                permmanual_idx = _PERMMANUAL_LOGIN_IDX
+        else:
+            permmanual_idx = tuple(t - 1 for t in permmanual)
 
         # Generate random PERMGEN (Python standard library only)
-        PERMGEN = random.sample(range(1, 9), 8)
+        PERMGEN = list(_PERM_BASE)
+        random.shuffle(PERMGEN)
 
         # Generate random numbers
         RAND_LAST = random.randint(0, 99)
@@ -70,22 +101,14 @@ class CombivoxAuth:
         TVALUE1 = self.code + RAND_LAST
 
         # TVALUE2 = apply permmanual (PERMMANUAL_LOGIN or PERMMANUAL_COMMAND)
-        TVALUE2 = ""
-        for t in permmanual:
-            NEWNUMBER = TVALUE1[t - 1]
-            TVALUE2 += NEWNUMBER
+        TVALUE2 = "".join(TVALUE1[i] for i in permmanual_idx)
 
         # TVALUE3 = apply PERMGEN
-        TVALUE3 = ""
-        for t in PERMGEN:
-            NEWNUMBER = TVALUE2[t - 1]
-            TVALUE3 += NEWNUMBER
+        permgen_idx = [t - 1 for t in PERMGEN]
+        TVALUE3 = "".join(TVALUE2[i] for i in permgen_idx)
 
-        # TVALUE4PERMGEN = PERMGEN - 1 for each element
-        TVALUE4PERMGEN = ""
-        for t in PERMGEN:
-            NEWNUMBER = str(t - 1)
-            TVALUE4PERMGEN += NEWNUMBER
+        # TVALUE4PERMGEN = PERMGEN - 1 for each element (single digits 0-7, 47 + t = ord("0") + t - 1)
+        TVALUE4PERMGEN = bytes(47 + t for t in PERMGEN).decode("ascii")
 
         # TVALUE4 = RAND_BEGIN + TVALUE3 + TVALUE4PERMGEN
         password = RAND_BEGIN + TVALUE3 + TVALUE4PERMGEN
@@ -94,7 +117,7 @@ class CombivoxAuth:
 
         # Base64 encoding with username
         credentials = f"{username}:{password}"
-        b64_auth = base64.b64encode(credentials.encode()).decode()
+        b64_auth = b2a_base64(credentials.encode("ascii"), newline=False).decode("ascii")
 
         _LOGGER.debug("Base64 string: %s", b64_auth)
 
@@ -110,14 +133,52 @@ class CombivoxAuth:
         Returns:
             True if authentication successful, False otherwise
         """
+        async with self._login_lock:
+            return await self._authenticate(username)
+
+    async def ensure_authenticated(self, username: str = "admin") -> bool:
+        """
+        Log in unless already authenticated.
+
+        Concurrent callers wait for a login already in progress and reuse its
+        cookie instead of starting another one.
+
+        Args:
+            username: Username for authentication (default: "admin")
+
+        Returns:
+            True if authenticated, False otherwise
+        """
+        if self.is_authenticated():
+            return True
+        async with self._login_lock:
+            if self.is_authenticated():
+                return True
+            return await self._authenticate(username)
+
+    async def _authenticate(self, username: str) -> bool:
+        """Run the login.cgi/login2.cgi sequence (caller holds the login lock)."""
         try:
             # Generate password and base64 auth
             _, b64_auth = self._generate_password(username)
 
-            # Create aiohttp session with cookie jar
-            cookie_jar = aiohttp.CookieJar(quote_cookie=False)
-            connector = aiohttp.TCPConnector(force_close=False)
-            self._session = aiohttp.ClientSession(cookie_jar=cookie_jar, connector=connector)
+            # Reuse the session across re-authentications (keeps pooled keep-alive
+            # sockets), only dropping the stale cookies
+            if self.session is None or self.session.closed:
+                # unsafe=True: the panel is addressed by IP, which the default jar rejects
+                cookie_jar = aiohttp.CookieJar(quote_cookie=False, unsafe=True)
+                # Single embedded host polled every few seconds: keep sockets alive
+                # across poll intervals and retry backoffs, with bounded parallelism
+                connector = aiohttp.TCPConnector(
+                    limit=_CONNECTOR_LIMIT,
+                    limit_per_host=_CONNECTOR_LIMIT,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    force_close=False,
+                )
+                self.session = aiohttp.ClientSession(cookie_jar=cookie_jar, connector=connector)
+            else:
+                self.session.cookie_jar.clear()
+            self.cookie = None
 
             # Build URL with Basic auth as query parameter (as in bash script)
             # NOTE: "http://IP/login.cgi?Basic%20${B64}"
@@ -130,69 +191,61 @@ class CombivoxAuth:
             # First call to login.cgi
             _LOGGER.debug("Calling %s", login_url)
 
-            async with self._session.post(
+            async with self.session.post(
                 login_url,
                 data=data,
                 timeout=self.timeout
             ) as response:
                 if response.status != 200:
                     _LOGGER.error("Error login.cgi: HTTP status %d, payload=%s", response.status, data)
-                    await self.close()
+                    self._clear_cookie()
                     return False
 
                 _LOGGER.debug("Response login.cgi: HTTP status:%d, payload=%s", response.status, data)
 
-            # Delay 1 second
-            await asyncio.sleep(1)
-
             # Second call to login2.cgi with timing
             _LOGGER.debug("Calling %s with timing", login2_url)
 
-            for delay in [2, 3, 4, 5, 6, 7]:
-                await asyncio.sleep(1)
+            # Short delay before the first probe, growing backoff between retries
+            for delay in _LOGIN2_RETRY_DELAYS:
+                await asyncio.sleep(delay)
 
-                async with self._session.post(
+                async with self.session.post(
                     login2_url,
                     data=data,
                     timeout=self.timeout
                 ) as response:
-                    # Check for cookie in response
-                    if response.cookies:
-                        # Take the first cookie
-                        for cookie_name, cookie_value in response.cookies.items():
-                            self._cookie = f"{cookie_name}={cookie_value.value}"
-                            _LOGGER.info("Authentication successful to Combivox panel at %s:%s", self.ip_address, self.port)
+                    # Only a cookie set by login2.cgi itself counts: the jar may still hold
+                    # one from login.cgi or an earlier probe while the panel is not ready.
+                    # aiohttp already stores it in the session jar for later requests.
+                    morsel = next(iter(response.cookies.values()), None)
+                    if morsel is not None:
+                        self.cookie = f"{morsel.key}={morsel.value}"
+                        _LOGGER.info("Authentication successful to Combivox panel at %s:%s", self.ip_address, self.port)
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
                             _LOGGER.debug("All response cookies: %s", dict(response.cookies))
-                            return True
-
-                    # Also check in session cookie_jar
-                    if self._session.cookie_jar:
-                        for cookie in self._session.cookie_jar:
-                            self._cookie = f"{cookie}={self._session.cookie_jar[cookie]}"
-                            _LOGGER.info("Authentication successful to Combivox panel at %s:%s", self.ip_address, self.port)
-                            _LOGGER.debug("All session cookies: %s", dict(self._session.cookie_jar))
-                            return True
+                        return True
 
             _LOGGER.error("No cookie found after authentication")
-            await self.close()
+            self._clear_cookie()
             return False
 
         except Exception as e:
             _LOGGER.error("Error during authentication: %s", e)
-            await self.close()
+            self._clear_cookie()
             return False
 
     def get_cookie(self) -> Optional[str]:
         """Return the session cookie."""
-        return self._cookie
+        return self.cookie
 
     def get_session(self) -> Optional[aiohttp.ClientSession]:
         """Return the authenticated HTTP session."""
-        return self._session
+        return self.session
 
     def is_authenticated(self) -> bool:
         """Check if authenticated."""
-        return self._cookie is not None and self._session is not None
+        return self.cookie is not None and self.session is not None
 
     def generate_auth_for_command(self, username: str = "admin") -> str:
         """
@@ -210,9 +263,20 @@ class CombivoxAuth:
         _, b64_auth = self._generate_password(username)
         return b64_auth
 
+    def _clear_cookie(self):
+        """Forget the session cookie after a failed login (session is kept for reuse)."""
+        self.cookie = None
+        if self.session:
+            self.session.cookie_jar.clear()
+
     async def close(self):
-        """Close the HTTP session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
-            self._cookie = None
+        """
+        Close the HTTP session.
+
+        This is the only place the session is closed: re-authentication keeps it
+        (and its pooled keep-alive sockets), so call this on integration unload.
+        """
+        if self.session:
+            await self.session.close()
+            self.session = None
+            self.cookie = None
@@ -1,14 +1,28 @@
 """Base client for Combivox Amica Web integration."""
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Any
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Optional, Any, Tuple, Union
 
 import aiohttp
 
+try:
+    import orjson  # Bundled with Home Assistant core
+except ImportError:
+    orjson = None
+
 from .auth import CombivoxAuth
+from .exceptions import CombivoxCircuitOpenError, CombivoxConnectionError
 from .const import (
     STATUS_URL,
     JSCRIPT9_URL,
@@ -32,10 +46,185 @@ from .const import (
     MACRO_SUCCESS_CODE,
     ALARM_HEX_TO_AP_STATE,
 )
-from .xml_parser import CombivoxXMLParser
+from .xml_parser import CombivoxArea, CombivoxXMLParser, CombivoxZone
 
 _LOGGER = logging.getLogger(__name__)
 
+# Delay (seconds) after a reqProg.cgi trigger before reading the populated XML
+_TRIGGER_SETTLE_DELAY = 0.5
+
+# numComandiProg.xml attempts after the trigger (backoff as for labels): together with
+# the settle delay this waits up to ~3s for the panel to populate the command list
+_COMMAND_IDS_MAX_ATTEMPTS = 4
+
+# Fallback area IDs when no areas config has been loaded
+_DEFAULT_AREA_IDS = tuple(range(1, 9))
+
+# Label download retries: attempts, then backoff doubling from base up to max (seconds)
+_LABEL_MAX_ATTEMPTS = 10
+_LABEL_RETRY_BASE_DELAY = 0.25
+_LABEL_RETRY_MAX_DELAY = 1.0
+
+# Status poll retries (kept low to avoid long blocking during polling) and base delay (seconds)
+_STATUS_MAX_RETRIES = 1
+_STATUS_BASE_DELAY = 1.0
+
+# Backoff ceiling (seconds) and exponent cap for retry delays
+_BACKOFF_MAX_DELAY = 30.0
+_BACKOFF_MAX_EXPONENT = 5
+
+# Circuit breaker: consecutive failures before pausing requests, pause length (seconds)
+_BREAKER_FAIL_THRESHOLD = 5
+_BREAKER_RESET_TIMEOUT = 30.0
+
+# jscript9.js panel variables (single or double quoted) and model name casing fixes
+_VERTYPE_RE = re.compile(r'var\s+vertype\s*=\s*["\']([^"\']+)["\']')
+_TYPWEB_RE = re.compile(r'var\s+typWeb\s*=\s*["\']([^"\']+)["\']')
+_AMICA_RE = re.compile(r'\bAMICA\b')
+_ELISA_RE = re.compile(r'\bELISA\b')
+
+# Body prefixes of the HTML login page served instead of XML when the session expired
+_HTML_PREFIXES = (b'<!doctype html', b'<html')
+
+# Bytes of the body inspected (lowercased) when looking for an HTML page
+_HTML_SNIFF_SIZE = 256
+
+# Content types of a genuine XML response
+_XML_CONTENT_TYPES = ('text/xml', 'application/xml')
+
+# Raw execChangeImp.xml success sentinel, matched before any decoding
+_MACRO_OK = f"<nc>{MACRO_SUCCESS_CODE}</nc>".encode("ascii")
+
+# Characters allowed in hex-encoded panel labels
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Pre-encoded execDelMem.xml body (clear alarm memory)
+_CLEAR_MEM_PAYLOAD = "comandi=del"
+
+# Max concurrent HTTP requests to the panel (embedded server with few TCP slots)
+_MAX_CONCURRENT_REQUESTS = 3
+
+# insAree.xml fIns value for each arm_mode:
+# fIns=0 normale (ritardo)
+# fIns=1 forzato (aree aperte)
+# fIns=2 stay (no ritardo su zone con ritardo)
+_ARM_MODE_TO_FINS = MappingProxyType({
+    "normal": 0,
+    "immediate": 2,   # stay mode
+    "forced": 1,
+})
+
+# bIns0 bit for each area (index 0 = area 1), up to the 32 areas the payload supports
+_AREA_MASKS = tuple(1 << i for i in range(32))
+
+
+def _backoff_delay(attempt: int, base: float = 1.0, cap: float = _BACKOFF_MAX_DELAY) -> float:
+    """
+    Exponential backoff with full jitter for retry number `attempt` (0-based).
+
+    A random delay in [0, min(cap, base * 2**attempt)] keeps concurrent callers
+    (polling, services, config reloads) from retrying in lockstep.
+    """
+    return random.uniform(0, min(cap, base * (2 ** min(attempt, _BACKOFF_MAX_EXPONENT))))
+
+
+def _areas_bitmask(areas: List[int], max_area: int = len(_AREA_MASKS)) -> int:
+    """Build the bIns0 bitmask for 1-based area IDs, ignoring IDs outside 1..max_area."""
+    max_area = min(max_area, len(_AREA_MASKS))
+    mask = 0
+    for area in areas:
+        if 1 <= area <= max_area:
+            mask |= _AREA_MASKS[area - 1]
+    return mask
+
+
+def _reauthenticate(failure_result: Any = False) -> Callable:
+    """
+    Decorate a client command so it logs in again first when the session is not authenticated.
+
+    Args:
+        failure_result: Returned (as a copy) without running the command if reauthentication fails
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self: "CombivoxWebClient", *args: Any, **kwargs: Any) -> Any:
+            if not self._auth.is_authenticated():
+                _LOGGER.warning("Not authenticated, attempting reauthentication...")
+                # Shares a login already started by a concurrent command
+                if not await self._auth.ensure_authenticated():
+                    _LOGGER.error("Reauthentication failed")
+                    return copy.copy(failure_result)
+                _LOGGER.info("Reauthentication successful")
+            return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _read_config_file(path: str) -> Optional[Dict[str, Any]]:
+    """Read the cached JSON config file (blocking, run in executor).
+
+    Returns:
+        Decoded config dict, or None if the file does not exist
+    """
+    try:
+        with open(path, "rb") as config_file:
+            data = config_file.read()
+    except FileNotFoundError:
+        return None
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_config_file(path: str, config: Dict[str, Any]) -> None:
+    """Write the cached JSON config file (blocking, run in executor)."""
+    if orjson is not None:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config, ensure_ascii=False, indent=2).encode("utf-8")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as config_file:
+        config_file.write(payload)
+
+
+class _CircuitBreaker:
+    """
+    Fail fast while the panel is unreachable.
+
+    Closed: requests pass. After `fail_threshold` consecutive failures it opens
+    and rejects requests for `reset_timeout` seconds, then half-opens: requests
+    pass again, one more failure re-opens it and a success closes it.
+    """
+
+    def __init__(self, fail_threshold: int, reset_timeout: float):
+        """Initialize the breaker (closed)."""
+        self._fail_threshold = fail_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        return self._opened_at is None or time.monotonic() - self._opened_at >= self._reset_timeout
+
+    def record_success(self) -> None:
+        """Close the breaker after the panel answered."""
+        if self._opened_at is not None:
+            _LOGGER.info("Panel reachable again, resuming requests")
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self._fail_threshold:
+            if self._opened_at is None:
+                _LOGGER.warning("Panel unreachable after %d consecutive failures, pausing requests for %ds",
+                                self._failures, self._reset_timeout)
+            self._opened_at = time.monotonic()
+
 
 class CombivoxWebClient:
     """HTTP client for Combivox Amica."""
@@ -61,26 +250,90 @@ class CombivoxWebClient:
         self.ip_address = ip_address
         self.code = code
         self.port = port
-        self.timeout = timeout
         self.base_url = f"http://{ip_address}:{port}"
 
+        # Headers required by the panel, built once as read-only views so every
+        # request and retry shares them without copying
+        self._referer_index2 = MappingProxyType({"Referer": f"{self.base_url}/index.htm?id=2"})
+        self._referer_index6 = MappingProxyType({"Referer": f"{self.base_url}/index.htm?id=6"})
+        self._reqprog_headers = MappingProxyType({
+            "Referer": f"{self.base_url}/index.htm?id=10&req=0",
+            "Content-Type": "text/plain;charset=UTF-8",
+        })
+        # Pre-encoded form bodies keep the urlencoded content type the panel expects
+        self._form_headers = MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+
         # Config file path
         self._config_file_path = config_file_path
 
         # Authentication
         self._auth = CombivoxAuth(ip_address, code, port, timeout)
+        # Shared aiohttp.ClientTimeout, reused by every panel request
+        self.timeout = self._auth.timeout
+
+        # Per-panel request limiter: retry loops, config downloads and the status
+        # poller must not pile up connections on the embedded HTTP server
+        self._request_sem = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        # Shared by every panel request so a dead panel fails fast everywhere
+        self._breaker = _CircuitBreaker(_BREAKER_FAIL_THRESHOLD, _BREAKER_RESET_TIMEOUT)
 
         # XML Parser
         self._parser = CombivoxXMLParser()
+        _LOGGER.debug("Status XML parser backend: %s", self._parser.parser_backend)
 
         # Data cache
-        self._zones_config: List[Dict[str, Any]] = []
-        self._areas_config: List[Dict[str, Any]] = []
+        self._zones_config: List[CombivoxZone] = []
+        self._areas_config: List[CombivoxArea] = []
         self._area_name_map: Dict[int, str] = {}  # Cache for area_id -> area_name lookup
+        self._all_area_ids: Tuple[int, ...] = ()  # Cache of all configured area IDs
         self._macros_config: List[Dict[str, Any]] = []
+        self._macro_name_map: Dict[int, str] = {}  # Cache for macro_id -> macro_name lookup
         self._commands_config: List[Dict[str, Any]] = []
         self._zone_ids: List[int] = []  # Active zone IDs from numZoneProg.xml
         self._device_info: Optional[Dict[str, Any]] = None
+        self._config_hash: int = 0  # Hash of zone/macro/command IDs, for reload change detection
+        self._saved_content_hash: Optional[int] = None  # Content hash of the cache file on disk
+        self._last_memory_id: Optional[str] = None  # Last alarm memory ID from numMemProg.xml
+        self._memory_label_cache: Optional[Tuple[str, str, str]] = None  # (memory ID, hex label, decoded message)
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request on the pooled client session, gated by the limiter and circuit breaker.
+
+        Network errors, timeouts and 5xx responses count as failures.
+
+        Args:
+            method: HTTP method ("GET" or "POST")
+            url: Request URL
+            **kwargs: Extra aiohttp request arguments (headers, data)
+
+        Yields:
+            The aiohttp response
+
+        Raises:
+            CombivoxCircuitOpenError: If the breaker is open (no request is sent)
+            CombivoxConnectionError: If there is no HTTP session (closed or never logged in)
+        """
+        if not self._breaker.allow():
+            raise CombivoxCircuitOpenError("Panel unreachable, request skipped")
+
+        session = self._auth.session
+        if session is None:
+            raise CombivoxConnectionError("No HTTP session available")
+
+        try:
+            async with self._request_sem, session.request(
+                method, url, timeout=self.timeout, **kwargs
+            ) as response:
+                if response.status >= 500:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+                yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._breaker.record_failure()
+            raise
 
     def is_config_loaded(self) -> bool:
         """
@@ -91,6 +344,22 @@ class CombivoxWebClient:
         """
         return bool(self._zones_config or self._areas_config or self._macros_config or self._commands_config)
 
+    def _update_config_hash(self) -> int:
+        """
+        Recompute the hash of the loaded zone, macro and command IDs.
+
+        Returns:
+            The new config hash (also stored on the instance)
+        """
+        # Zone and macro IDs reuse the lookups built at load time; only the
+        # commands list needs walking
+        self._config_hash = hash((
+            tuple(self._zone_ids),
+            tuple(self._macro_name_map),
+            tuple(c.get("command_id") for c in self._commands_config),
+        ))
+        return self._config_hash
+
     async def connect(self) -> bool:
         """
         Connect to the panel and download configuration.
@@ -104,18 +373,18 @@ class CombivoxWebClient:
             if not await self._authenticate_and_download_config():
                 return False
 
-            # Try to fetch initial status, but don't fail if offline
+            # Initial status and device variant info (jscript9.js) are independent
+            # reads: fetch them concurrently, and don't fail if offline
             # (we might have cached config)
-            try:
-                await self._fetch_initial_status()
-            except Exception as e:
-                _LOGGER.warning("Could not fetch initial status (panel may be offline): %s", e)
-
-            # Try to fetch device variant info from jscript9.js
-            try:
-                await self._fetch_device_info()
-            except Exception as e:
-                _LOGGER.warning("Could not fetch device variant info: %s", e)
+            status_result, device_info_result = await asyncio.gather(
+                self._fetch_initial_status(),
+                self._fetch_device_info(),
+                return_exceptions=True,
+            )
+            if isinstance(status_result, Exception):
+                _LOGGER.warning("Could not fetch initial status (panel may be offline): %s", status_result)
+            if isinstance(device_info_result, Exception):
+                _LOGGER.warning("Could not fetch device variant info: %s", device_info_result)
 
             # If we have config (cached or fresh), connection is successful enough
             return self.is_config_loaded()
@@ -139,37 +408,28 @@ class CombivoxWebClient:
         _LOGGER.info("Reloading configuration from panel (reusing existing session)")
 
         # Store previous config for comparison
-        prev_zones_count = len(self._zones_config) if self._zones_config else 0
-        prev_macros_count = len(self._macros_config) if self._macros_config else 0
-        prev_commands_count = len(self._commands_config) if self._commands_config else 0
-        prev_zone_ids = set(self._zone_ids) if self._zone_ids else set()
-        prev_macro_ids = set(m.get("id") for m in self._macros_config) if self._macros_config else set()
-        prev_command_ids = set(c.get("id") for c in self._commands_config) if self._commands_config else set()
+        prev_zones_count = len(self._zones_config)
+        prev_macros_count = len(self._macros_config)
+        prev_commands_count = len(self._commands_config)
+        prev_hash = self._config_hash
 
         # Re-download configuration using existing session (don't reauthenticate)
         try:
-            # Download zones and areas (uses existing session)
-            prog_state = await self._download_prog_state_config()
+            # Download zones/areas, macros and commands concurrently (uses existing session)
+            prog_state, macros_config, commands_config = await self._download_all_config()
+
             if prog_state:
-                new_zones = prog_state.get("zones", [])
-                new_areas = prog_state.get("areas", [])
-                self._zones_config = new_zones
-                self._zone_ids = [z["zone_id"] for z in new_zones]
-                self._areas_config = new_areas
-                self._area_name_map = {area["area_id"]: area["area_name"] for area in new_areas}
+                self._apply_prog_state(prog_state)
             else:
                 _LOGGER.warning("Failed to download zones/areas config during reload")
                 return False
 
-            # Download macros (uses existing session)
-            macros_config = await self._download_macros_config()
             if macros_config:
                 self._macros_config = macros_config
+                self._macro_name_map = {m["macro_id"]: m.get("macro_name", "Unknown") for m in macros_config}
             else:
                 _LOGGER.warning("Failed to download macros config during reload")
 
-            # Download commands (uses existing session)
-            commands_config = await self._download_commands_config()
             if commands_config:
                 self._commands_config = commands_config
             else:
@@ -179,23 +439,12 @@ class CombivoxWebClient:
             if self._config_file_path:
                 await self._save_config_to_file()
 
-            # Compare configurations
-            new_zones_count = len(self._zones_config) if self._zones_config else 0
-            new_macros_count = len(self._macros_config) if self._macros_config else 0
-            new_commands_count = len(self._commands_config) if self._commands_config else 0
-            new_zone_ids = set(self._zone_ids) if self._zone_ids else set()
-            new_macro_ids = set(m.get("id") for m in self._macros_config) if self._macros_config else set()
-            new_command_ids = set(c.get("id") for c in self._commands_config) if self._commands_config else set()
-
-            # Check for changes
-            zones_changed = (prev_zones_count != new_zones_count or
-                            prev_zone_ids != new_zone_ids)
-            macros_changed = (prev_macros_count != new_macros_count or
-                             prev_macro_ids != new_macro_ids)
-            commands_changed = (prev_commands_count != new_commands_count or
-                               prev_command_ids != new_command_ids)
-
-            if zones_changed or macros_changed or commands_changed:
+            # Compare configurations (IDs hash covers added, removed and renumbered items)
+            new_zones_count = len(self._zones_config)
+            new_macros_count = len(self._macros_config)
+            new_commands_count = len(self._commands_config)
+
+            if self._update_config_hash() != prev_hash:
                 _LOGGER.info("Configuration changed - zones: %d→%d, macros: %d→%d, commands: %d→%d",
                            prev_zones_count, new_zones_count,
                            prev_macros_count, new_macros_count,
@@ -239,34 +488,66 @@ class CombivoxWebClient:
             # If we have cached config, we can still work
             return has_cached_config
 
-        # Download zones and areas configuration from labelProgStato.xml (much cleaner!)
-        prog_state = await self._download_prog_state_config()
+        # Download zones/areas (labelProgStato.xml), macros and commands concurrently
+        prog_state, macros_config, commands_config = await self._download_all_config()
+
         if prog_state:
-            self._zones_config = prog_state.get("zones", [])
-            self._zone_ids = [z["zone_id"] for z in self._zones_config]
-            self._areas_config = prog_state.get("areas", [])
-            self._area_name_map = {area["area_id"]: area["area_name"] for area in self._areas_config}
+            self._apply_prog_state(prog_state)
             _LOGGER.info("Loaded configuration: %d zones, %d areas",
                        len(self._zones_config), len(self._areas_config))
 
-        # Download macros configuration (scenarios)
-        macros_config = await self._download_macros_config()
+        # Macros configuration (scenarios)
         if macros_config:
             self._macros_config = macros_config
+            self._macro_name_map = {m["macro_id"]: m.get("macro_name", "Unknown") for m in macros_config}
             _LOGGER.info("Loaded %d macros (scenarios)", len(self._macros_config))
 
-        # Download commands configuration
-        commands_config = await self._download_commands_config()
+        # Commands configuration
         if commands_config:
             self._commands_config = commands_config
             _LOGGER.info("Loaded %d commands", len(self._commands_config))
 
+        self._update_config_hash()
+
         # Save to file if path provided
         if self._config_file_path and (prog_state or macros_config or commands_config):
             await self._save_config_to_file()
 
         return True
 
+    def _apply_prog_state(self, prog_state: Dict[str, Any]) -> None:
+        """Store zones/areas parsed from labelProgStato.xml, with the lookups built by the parser."""
+        self._zones_config = prog_state["zones"]
+        self._zone_ids = prog_state["zone_ids"]
+        self._areas_config = prog_state["areas"]
+        self._area_name_map = prog_state["area_name_map"]
+        self._all_area_ids = tuple(self._area_name_map)
+
+    async def _download_all_config(self) -> Tuple[Any, Any, Any]:
+        """
+        Download zones/areas, macros and commands configuration concurrently.
+
+        The three downloads are independent I/O on the same session, so the
+        total time is the slowest download instead of the sum of all three.
+
+        Returns:
+            Tuple (prog_state, macros_config, commands_config), None for failed downloads
+        """
+        results = await asyncio.gather(
+            self._download_prog_state_config(),
+            self._download_macros_config(),
+            self._download_commands_config(),
+            return_exceptions=True,
+        )
+
+        labels = ("zones/areas", "macros", "commands")
+        for index, (label, result) in enumerate(zip(labels, results)):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error downloading %s configuration: %s", label, result)
+                results[index] = None
+
+        return tuple(results)
+
     async def _fetch_initial_status(self) -> None:
         """
         Fetch initial alarm status.
@@ -290,42 +571,35 @@ class CombivoxWebClient:
                        self._device_info.get("variant", "Unknown"),
                        self._device_info.get("state"))
 
-    async def _download_prog_state_config(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    async def _download_prog_state_config(self) -> Optional[Dict[str, Any]]:
         """
         Download zones and areas configuration from labelProgStato.xml.
 
         This file contains ALL names in one place, much cleaner!
 
         NOTE: We must first trigger the XML generation by calling reqProg.cgi?req=255
-        and waiting a couple of seconds for the file to be populated.
+        and retrying the download until the file is populated.
 
         Returns:
-            Dict with {"zones": [...], "areas": [...]} or None if error
+            Dict with zones, areas, area_name_map and zone_ids (see parser) or None if error
         """
         try:
             if not self._auth.is_authenticated():
                 _LOGGER.error("Not authenticated, cannot download configuration")
                 return None
 
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
             # Step 1: Trigger data population (id=9 for general data)
             # This is required to populate the data before downloading
             trigger_url = f"{self.base_url}/reqProg.cgi?id=9"
 
             # Add Referer header as required by the panel
-            headers_with_referer = headers.copy()
-            headers_with_referer["Referer"] = f"{self.base_url}/index.htm?id=6"
+            headers_with_referer = self._referer_index6
 
             _LOGGER.debug("Triggering data population: URL=%s, Referer=%s",
                          trigger_url, headers_with_referer.get("Referer"))
 
             try:
-                async with session.get(trigger_url, headers=headers_with_referer, timeout=self.timeout) as response:
+                async with self._request("GET", trigger_url, headers=headers_with_referer) as response:
                     if response.status == 200:
                         _LOGGER.debug("Data population triggered successfully")
                     else:
@@ -333,45 +607,43 @@ class CombivoxWebClient:
             except Exception as e:
                 _LOGGER.warning("Failed to trigger data population: %s (continuing anyway)", e)
 
-            # Step 2: Wait 2 seconds for data to be populated
-            await asyncio.sleep(2)
+            # Step 2: Short settle delay - the retry loop below absorbs any
+            # remaining populate time (a warm panel answers on the first GET)
+            await asyncio.sleep(_TRIGGER_SETTLE_DELAY)
 
             # Step 3: Download the actual XML file
             url = f"{self.base_url}/labelProgStato.xml"
-            _LOGGER.debug("Downloading labelProgStato.xml: URL=%s, cookie=%s",
-                         url, cookie)
+            _LOGGER.debug("Downloading labelProgStato.xml: URL=%s", url)
 
             # Try multiple times to download (panel takes time to respond)
             max_retries = 5
-            text = None
+            downloaded = False
 
             for attempt in range(1, max_retries + 1):
                 _LOGGER.debug("Downloading labelProgStato.xml (attempt %d/%d)", attempt, max_retries)
 
-                async with session.get(url, headers=headers, timeout=self.timeout) as response:
+                async with self._request("GET", url) as response:
                     if response.status == 200:
-                        text = await response.text()
-                        _LOGGER.info("Downloaded labelProgStato.xml successfully on attempt %d (%d bytes)", attempt, len(text))
-                        break
-                    else:
-                        _LOGGER.warning("Attempt %d failed: status %d", attempt, response.status)
-                        if attempt < max_retries:
-                            await asyncio.sleep(1)  # Wait 1 second between retries
+                        downloaded = True
 
-            if text is None:
-                _LOGGER.error("Failed to download labelProgStato.xml after %d attempts", max_retries)
-                return None
+                        # Parse zones and areas while the body streams in (empty = not populated yet)
+                        prog_state = await self._parser.parse_prog_state_stream(response.content)
+                        if prog_state and (prog_state.get("zones") or prog_state.get("areas")):
+                            _LOGGER.info("Downloaded labelProgStato.xml successfully on attempt %d", attempt)
+                            return prog_state
 
-            _LOGGER.debug("labelProgStato.xml content (first 500 chars): %s", text[:500])
+                        _LOGGER.warning("Attempt %d: no zones or areas in labelProgStato.xml yet", attempt)
+                    else:
+                        _LOGGER.warning("Attempt %d failed: status %d", attempt, response.status)
 
-            # Parse zones and areas from XML file
-            prog_state = self._parser.parse_prog_state_labels(text)
+                if attempt < max_retries:
+                    await asyncio.sleep(1)  # Wait 1 second between retries
 
-            if prog_state and (prog_state.get("zones") or prog_state.get("areas")):
-                return prog_state
+            if not downloaded:
+                _LOGGER.error("Failed to download labelProgStato.xml after %d attempts", max_retries)
             else:
                 _LOGGER.warning("No zones or areas found in labelProgStato.xml")
-                return None
+            return None
 
         except Exception as e:
             _LOGGER.error("Error downloading labelProgStato.xml configuration: %s", e)
@@ -394,26 +666,20 @@ class CombivoxWebClient:
                 _LOGGER.error("Not authenticated, cannot download macros configuration")
                 return None
 
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
             # Step 1: Download numMacro.xml to get macro IDs
             url = f"{self.base_url}{NUMMACRO_URL}"
             _LOGGER.debug("Downloading numMacro.xml: URL=%s", url)
 
-            async with session.get(url, headers=headers, timeout=self.timeout) as response:
+            async with self._request("GET", url) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to download numMacro.xml: status %d", response.status)
                     return None
 
-                text = await response.text()
-                _LOGGER.debug("Downloaded numMacro.xml successfully (%d bytes)", len(text))
+                body = await response.read()
+                _LOGGER.debug("Downloaded numMacro.xml successfully (%d bytes)", len(body))
 
             # Parse macro IDs
-            macro_ids = self._parser.parse_macro_ids(text)
+            macro_ids = self._parser.parse_macro_ids(body)
             if not macro_ids:
                 _LOGGER.info("No macros found in numMacro.xml")
                 return []
@@ -421,45 +687,26 @@ class CombivoxWebClient:
             _LOGGER.debug("Found %d macro IDs: %s", len(macro_ids), macro_ids)
 
             # Step 2: Download macro labels using the IDs
-            # Build comandi parameter with macro IDs
-            comandi_param = ";".join(str(m_id) for m_id in macro_ids) + ";"
             labels_url = f"{self.base_url}/labelMacro.xml"
 
-            # Build POST payload
-            payload = f"comandi={comandi_param}"
+            # Build POST payload once (comandi=<id>;<id>;...;), reused by every retry
+            payload = f"comandi={';'.join(map(str, macro_ids))};"
 
             # Add Referer header as required by the panel
-            headers_with_referer = headers.copy()
-            headers_with_referer["Referer"] = f"{self.base_url}/index.htm?id=2"
-
-            # TEMPORARY TEST: Try multiple times to download labels (panel takes time to respond)
-            max_retries = 10
-            text = None
+            headers_with_referer = self._referer_index2
 
-            for attempt in range(1, max_retries + 1):
-                _LOGGER.debug("Downloading macro labels (attempt %d/%d): URL=%s, Referer=%s, cookie=%s, payload=%s",
-                             attempt, max_retries, labels_url, headers_with_referer.get("Referer"),
-                             cookie, payload)
+            # Retry while the panel populates the labels (fails fast on 4xx)
+            body = await self._download_labels(labels_url, headers_with_referer, payload, "macro labels")
 
-                async with session.post(labels_url, headers=headers_with_referer, data=payload, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        text = await response.text()
-                        _LOGGER.info("Downloaded macro labels successfully on attempt %d (%d bytes)", attempt, len(text))
-                        break
-                    else:
-                        _LOGGER.warning("Attempt %d failed: status %d", attempt, response.status)
-                        if attempt < max_retries:
-                            await asyncio.sleep(1)  # Wait 1 second between retries
-
-            if text is None:
-                _LOGGER.warning("Failed to download macro labels after %d attempts (using IDs only)", max_retries)
+            if body is None:
+                _LOGGER.warning("Failed to download macro labels (using IDs only)")
                 # Return macros without names
                 return [{"macro_id": m_id, "macro_name": f"Macro {m_id}"} for m_id in macro_ids]
 
-            _LOGGER.debug("Macro labels downloaded successfully (%d bytes)", len(text))
+            _LOGGER.debug("Macro labels downloaded successfully (%d bytes)", len(body))
 
             # Step 3: Parse macro labels
-            macros = self._parser.parse_macro_labels(text, macro_ids)
+            macros = self._parser.parse_macro_labels(body, macro_ids)
 
             if macros:
                 _LOGGER.debug("Parsed %d macro labels", len(macros))
@@ -478,7 +725,7 @@ class CombivoxWebClient:
 
         Process:
         1. GET reqProg.cgi?id=4&idc=49 to trigger command data population
-        2. Wait 2 seconds for data to be populated
+        2. Wait briefly for data to be populated
         3. GET numComandiProg.xml to get command IDs
         4. POST with payload comandi=id1;id2;etc to get command labels
         5. Parse labels and return list of commands with types
@@ -491,25 +738,18 @@ class CombivoxWebClient:
                 _LOGGER.error("Not authenticated, cannot download commands configuration")
                 return None
 
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
             # Step 1: Trigger command data population (id=4 for commands)
             # This is required to populate the data before downloading
             trigger_url = f"{self.base_url}/reqProg.cgi?id=4&idc=49"
 
             # Add Referer header as required by the panel
-            headers_with_referer = headers.copy()
-            headers_with_referer["Referer"] = f"{self.base_url}/index.htm?id=6"
+            headers_with_referer = self._referer_index6
 
             _LOGGER.debug("Triggering command data population: URL=%s, Referer=%s",
                          trigger_url, headers_with_referer.get("Referer"))
 
             try:
-                async with session.get(trigger_url, headers=headers_with_referer, timeout=self.timeout) as response:
+                async with self._request("GET", trigger_url, headers=headers_with_referer) as response:
                     if response.status == 200:
                         _LOGGER.debug("Command data population triggered successfully")
                     else:
@@ -517,23 +757,40 @@ class CombivoxWebClient:
             except Exception as e:
                 _LOGGER.warning("Failed to trigger command data population: %s (continuing anyway)", e)
 
-            # Step 2: Wait 2 seconds for data to be populated
-            await asyncio.sleep(2)
+            # Step 2: Short settle delay - the retry loop below absorbs any
+            # remaining populate time (a warm panel answers on the first GET)
+            await asyncio.sleep(_TRIGGER_SETTLE_DELAY)
 
-            # Step 3: Download numComandiProg.xml to get command IDs
+            # Step 3: Download numComandiProg.xml to get command IDs, retrying while
+            # the panel has not populated it yet (error status or no IDs)
             url = f"{self.base_url}{NUMCOMANDIPROG_URL}"
-            _LOGGER.debug("Downloading numComandiProg.xml: URL=%s", url)
+            command_ids: List[int] = []
+            status = 200
 
-            async with session.get(url, headers=headers, timeout=self.timeout) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to download numComandiProg.xml: status %d", response.status)
-                    return None
+            for attempt in range(1, _COMMAND_IDS_MAX_ATTEMPTS + 1):
+                _LOGGER.debug("Downloading numComandiProg.xml (attempt %d/%d): URL=%s",
+                             attempt, _COMMAND_IDS_MAX_ATTEMPTS, url)
+
+                async with self._request("GET", url) as response:
+                    status = response.status
+                    body = await response.read() if status == 200 else b""
 
-                text = await response.text()
-                _LOGGER.debug("Downloaded numComandiProg.xml successfully (%d bytes)", len(text))
+                if status == 200:
+                    _LOGGER.debug("Downloaded numComandiProg.xml successfully (%d bytes)", len(body))
+                    command_ids = self._parser.parse_command_ids(body)
+                    if command_ids:
+                        break
+                else:
+                    _LOGGER.debug("numComandiProg.xml returned status %d", status)
+
+                if attempt < _COMMAND_IDS_MAX_ATTEMPTS:
+                    await asyncio.sleep(min(_LABEL_RETRY_BASE_DELAY * 2 ** attempt, _LABEL_RETRY_MAX_DELAY))
+
+            if status != 200:
+                _LOGGER.error("Failed to download numComandiProg.xml: status %d", status)
+                return None
 
             # Parse command IDs
-            command_ids = self._parser.parse_command_ids(text)
             if not command_ids:
                 _LOGGER.info("No commands found in numComandiProg.xml")
                 return []
@@ -541,45 +798,26 @@ class CombivoxWebClient:
             _LOGGER.debug("Found %d command IDs: %s", len(command_ids), command_ids)
 
             # Step 4: Download command labels using the IDs
-            # Build comandi parameter with command IDs
-            comandi_param = ";".join(str(c_id) for c_id in command_ids) + ";"
             labels_url = f"{self.base_url}{LABELCOMANDI_URL}"
 
-            # Build POST payload
-            payload = f"comandi={comandi_param}"
+            # Build POST payload once (comandi=<id>;<id>;...;), reused by every retry
+            payload = f"comandi={';'.join(map(str, command_ids))};"
 
             # Add Referer header as required by the panel
-            headers_with_referer = headers.copy()
-            headers_with_referer["Referer"] = f"{self.base_url}/index.htm?id=6"
+            headers_with_referer = self._referer_index6
 
-            # Try multiple times to download labels (panel takes time to respond)
-            max_retries = 10
-            text = None
+            # Retry while the panel populates the labels (fails fast on 4xx)
+            body = await self._download_labels(labels_url, headers_with_referer, payload, "command labels")
 
-            for attempt in range(1, max_retries + 1):
-                _LOGGER.debug("Downloading command labels (attempt %d/%d): URL=%s, Referer=%s, cookie=%s, payload=%s",
-                             attempt, max_retries, labels_url, headers_with_referer.get("Referer"),
-                             cookie, payload)
-
-                async with session.post(labels_url, headers=headers_with_referer, data=payload, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        text = await response.text()
-                        _LOGGER.info("Downloaded command labels successfully on attempt %d (%d bytes)", attempt, len(text))
-                        break
-                    else:
-                        _LOGGER.warning("Attempt %d failed: status %d", attempt, response.status)
-                        if attempt < max_retries:
-                            await asyncio.sleep(1)  # Wait 1 second between retries
-
-            if text is None:
-                _LOGGER.warning("Failed to download command labels after %d attempts (using IDs only)", max_retries)
+            if body is None:
+                _LOGGER.warning("Failed to download command labels (using IDs only)")
                 # Return commands without names
                 return [{"command_id": c_id, "command_name": f"Command {c_id}", "command_type": "button"} for c_id in command_ids]
 
-            _LOGGER.debug("Command labels downloaded successfully (%d bytes)", len(text))
+            _LOGGER.debug("Command labels downloaded successfully (%d bytes)", len(body))
 
             # Step 5: Parse command labels
-            commands = self._parser.parse_command_labels(text, command_ids)
+            commands = self._parser.parse_command_labels(body, command_ids)
 
             if commands:
                 _LOGGER.debug("Parsed %d command labels", len(commands))
@@ -592,59 +830,126 @@ class CombivoxWebClient:
             _LOGGER.error("Error downloading commands configuration: %s", e)
             return None
 
+    async def _download_labels(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        payload: str,
+        label: str
+    ) -> Optional[bytes]:
+        """
+        POST a labels request, retrying while the panel is still populating it.
+
+        4xx responses fail fast: 401/403 mean the session expired (the next status
+        poll reauthenticates) and 404 means this panel has no such endpoint.
+        5xx, network errors and timeouts are retried with capped exponential backoff.
+
+        Args:
+            url: Labels XML URL
+            headers: Request headers (Referer required by the panel)
+            payload: POST payload (comandi=<id>;<id>;...;)
+            label: What is being downloaded, for logging
+
+        Returns:
+            Response body, or None if the labels could not be downloaded
+        """
+        for attempt in range(1, _LABEL_MAX_ATTEMPTS + 1):
+            _LOGGER.debug("Downloading %s (attempt %d/%d): URL=%s, Referer=%s, payload=%s",
+                         label, attempt, _LABEL_MAX_ATTEMPTS, url, headers.get("Referer"), payload)
+
+            try:
+                async with self._request("POST", url, headers=headers, data=payload) as response:
+                    status = response.status
+                    if status == 200:
+                        body = await response.read()
+                        _LOGGER.info("Downloaded %s successfully on attempt %d (%d bytes)", label, attempt, len(body))
+                        return body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _LOGGER.warning("Attempt %d failed: %r", attempt, e)
+            else:
+                if 400 <= status < 500:
+                    _LOGGER.warning("Attempt %d failed: status %d (not retrying)", attempt, status)
+                    return None
+                _LOGGER.warning("Attempt %d failed: status %d", attempt, status)
+
+            if attempt < _LABEL_MAX_ATTEMPTS:
+                await asyncio.sleep(min(_LABEL_RETRY_BASE_DELAY * 2 ** (attempt - 1), _LABEL_RETRY_MAX_DELAY))
+
+        return None
+
     async def _load_config_from_file(self) -> bool:
         """Load zones, areas, macros and commands configuration from JSON file."""
         try:
-            if not self._config_file_path or not os.path.exists(self._config_file_path):
+            if not self._config_file_path:
                 return False
 
-            import asyncio
-            loop = asyncio.get_event_loop()
-            config = await loop.run_in_executor(None, lambda: json.load(open(self._config_file_path, 'r', encoding='utf-8')))
+            # Existence check, read and JSON decode all happen in one executor job
+            loop = asyncio.get_running_loop()
+            config = await loop.run_in_executor(None, _read_config_file, self._config_file_path)
+            if config is None:
+                return False
 
             if 'zones' in config:
-                self._zones_config = config['zones']
+                self._zones_config = [CombivoxZone(z["zone_id"], z["zone_name"]) for z in config['zones']]
+                self._zone_ids = [z.zone_id for z in self._zones_config]
                 _LOGGER.info("Loaded %d zones from cache file", len(self._zones_config))
 
             if 'areas' in config:
-                self._areas_config = config['areas']
-                self._area_name_map = {area["area_id"]: area["area_name"] for area in self._areas_config}
+                self._areas_config = [CombivoxArea(a["area_id"], a["area_name"]) for a in config['areas']]
+                self._area_name_map = {area.area_id: area.area_name for area in self._areas_config}
+                self._all_area_ids = tuple(self._area_name_map)
                 _LOGGER.info("Loaded %d areas from cache file", len(self._areas_config))
 
             if 'macros' in config:
                 self._macros_config = config['macros']
+                self._macro_name_map = {m["macro_id"]: m.get("macro_name", "Unknown") for m in self._macros_config}
                 _LOGGER.info("Loaded %d macros from cache file", len(self._macros_config))
 
             if 'commands' in config:
                 self._commands_config = config['commands']
                 _LOGGER.info("Loaded %d commands from cache file", len(self._commands_config))
 
+            self._update_config_hash()
+            self._saved_content_hash = self._config_content_hash()
             return True
 
         except Exception as e:
             _LOGGER.warning("Failed to load config from file: %s", e)
             return False
 
+    def _config_content_hash(self) -> int:
+        """Hash the full cached configuration (names included, unlike _config_hash)."""
+        return hash((
+            tuple(self._zones_config),
+            tuple(self._areas_config),
+            tuple(tuple(m.items()) for m in self._macros_config),
+            tuple(tuple(c.items()) for c in self._commands_config),
+        ))
+
     async def _save_config_to_file(self) -> bool:
         """Save zones, areas, macros and commands configuration to JSON file."""
         try:
             if not self._config_file_path:
                 return False
 
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self._config_file_path), exist_ok=True)
+            # Skip the encode and disk write when the file already holds this config
+            content_hash = self._config_content_hash()
+            if content_hash == self._saved_content_hash:
+                _LOGGER.debug("Configuration unchanged, not rewriting cache file: %s", self._config_file_path)
+                return True
 
             config = {
-                "zones": self._zones_config,
-                "areas": self._areas_config,
+                "zones": [asdict(zone) for zone in self._zones_config],
+                "areas": [asdict(area) for area in self._areas_config],
                 "macros": self._macros_config,
                 "commands": self._commands_config,
             }
 
-            import asyncio
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, lambda: json.dump(config, open(self._config_file_path, 'w', encoding='utf-8'), ensure_ascii=False, indent=2))
+            # Directory creation, JSON encode and write all happen in one executor job
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_config_file, self._config_file_path, config)
 
+            self._saved_content_hash = content_hash
             _LOGGER.debug("Saved configuration to cache file: %s", self._config_file_path)
             return True
 
@@ -652,157 +957,184 @@ class CombivoxWebClient:
             _LOGGER.error("Failed to save configuration to file: %s", e)
             return False
 
-    async def get_status(self, retry_count: int = 0) -> Optional[Dict[str, Any]]:
+    async def get_status(self) -> Optional[Dict[str, Any]]:
         """
         Get the current panel status with automatic retry and reauthentication.
 
-        Args:
-            retry_count: Current retry attempt (used internally for recursion)
-
         Returns:
             Dict with complete status or None if error after all retries
         """
-        max_retries = 1  # Reduced from 3 to avoid long blocking during polling
-        base_delay = 1  # seconds
+        max_retries = _STATUS_MAX_RETRIES
+        url = f"{self.base_url}{STATUS_URL}"
 
-        try:
-            url = f"{self.base_url}{STATUS_URL}"
+        # Panel failed repeatedly: skip the poll (and the reauthentication) until the breaker half-opens
+        if not self._breaker.allow():
+            _LOGGER.debug("Panel circuit open, skipping status request")
+            return None
 
-            # NOTE: status9.xml requires cookie for some panels
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
+        try:
+            for attempt in range(max_retries + 1):
+                can_retry = attempt < max_retries
+                delay = _backoff_delay(attempt, _STATUS_BASE_DELAY)  # Exponential backoff with jitter
 
-            session = self._auth.get_session()
+                try:
+                    # NOTE: status9.xml requires cookie for some panels (sent from the session cookie jar)
+
+                    # If no session or not authenticated, try to authenticate first
+                    if not self._auth.session or not self._auth.is_authenticated():
+                        _LOGGER.warning("No authenticated session, attempting authentication...")
+                        if not await self._auth.ensure_authenticated():
+                            _LOGGER.error("Authentication failed for status request")
+                            # Fall back to unauthenticated request
+                            return await self._get_status_unauthenticated(url)
+
+                    # Try authenticated request. Only the request itself holds the limiter
+                    # slot, so the retries below never wait on a slot they already hold
+                    async with self._request("GET", url) as response:
+                        status = response.status
+                        # Parsed mimetype (lowercase, no charset parameter)
+                        content_type = response.content_type
+                        # Raw bytes: the XML parser decodes them itself
+                        body = await response.read() if status == 200 else b""
+
+                except aiohttp.ClientError as e:
+                    # Network error - retry with backoff
+                    if can_retry:
+                        _LOGGER.warning("Network error '%s', retrying in %.1fs (attempt %d/%d)",
+                                     e, delay, attempt + 1, max_retries)
+                        await asyncio.sleep(delay)
+                        continue
+                    _LOGGER.error("Network error after %d retries: %s", max_retries, e)
+                    return None
 
-            # If no session or not authenticated, try to authenticate first
-            if not session or not self._auth.is_authenticated():
-                _LOGGER.warning("No authenticated session, attempting authentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Authentication failed for status request")
-                    # Fall back to unauthenticated request
-                    return await self._get_status_unauthenticated(url, headers)
+                except asyncio.TimeoutError:
+                    # Timeout - retry with backoff
+                    if can_retry:
+                        _LOGGER.warning("Timeout, retrying in %.1fs (attempt %d/%d)",
+                                     delay, attempt + 1, max_retries)
+                        await asyncio.sleep(delay)
+                        continue
+                    _LOGGER.error("Timeout after %d retries", max_retries)
+                    return None
 
-            # Try authenticated request
-            try:
-                async with session.get(url, headers=headers, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        text = await response.text()
+                if status == 200:
+                    # Check if response is HTML (session expired) instead of XML before
+                    # parsing: trust an XML Content-Type, otherwise only look at the start
+                    # of the body (case-insensitive)
+                    is_html = False
+                    if content_type not in _XML_CONTENT_TYPES:
+                        head = body[:_HTML_SNIFF_SIZE].lstrip().lower()
+                        is_html = (
+                            content_type == 'text/html'
+                            or head.startswith(_HTML_PREFIXES)
+                            or b'<body' in head
+                        )
+                    if is_html:
+                        _LOGGER.warning("Received HTML instead of XML (session expired), attempting reauthentication...")
+                        if can_retry and await self._auth.authenticate():
+                            continue
+                        _LOGGER.error("Reauthentication failed after HTML response")
+                        return None
 
-                        # Check if response is HTML (session expired) instead of XML
-                        content_type = response.headers.get('Content-Type', '')
-                        if 'text/html' in content_type or text.strip().startswith('<!DOCTYPE') or text.strip().startswith('<html'):
-                            _LOGGER.warning("Received HTML instead of XML (session expired), attempting reauthentication...")
-                            if retry_count < max_retries:
+                    # Try to parse XML
+                    try:
+                        return self._parse_status_response(body)
+                    except Exception as parse_error:
+                        # XML parse error - might be session expired with weird response
+                        _LOGGER.warning("XML parse error: %s. Response might be HTML, trying reauthentication...", parse_error)
+                        if can_retry:
+                            # Check if response looks like HTML
+                            text = body.decode('utf-8', errors='replace').lower()
+                            if '<html' in text or '<body' in text or 'login' in text:
                                 if await self._auth.authenticate():
-                                    return await self.get_status(retry_count + 1)
-                            _LOGGER.error("Reauthentication failed after HTML response")
-                            return None
-
-                        # Try to parse XML
-                        try:
-                            return self._parse_status_response(text)
-                        except Exception as parse_error:
-                            # XML parse error - might be session expired with weird response
-                            _LOGGER.warning("XML parse error: %s. Response might be HTML, trying reauthentication...", parse_error)
-                            if retry_count < max_retries:
-                                # Check if response looks like HTML
-                                if '<html' in text.lower() or '<body' in text.lower() or 'login' in text.lower():
-                                    if await self._auth.authenticate():
-                                        return await self.get_status(retry_count + 1)
-                                # Retry with backoff anyway
-                                delay = base_delay * (2 ** retry_count)
-                                _LOGGER.warning("Retrying after parse error in %ds...", delay)
-                                await asyncio.sleep(delay)
-                                return await self.get_status(retry_count + 1)
-                            _LOGGER.error("XML parse error after %d retries: %s", max_retries, parse_error)
-                            return None
-                    elif response.status == 401 or response.status == 403:
-                        # Authentication error - try to reauthenticate
-                        _LOGGER.warning("Authentication error (HTTP %d), attempting reauthentication...",
-                                     response.status)
-                        if retry_count < max_retries:
-                            await asyncio.sleep(base_delay * (2 ** retry_count))  # Exponential backoff
-                            if await self._auth.authenticate():
-                                return await self.get_status(retry_count + 1)
-                        _LOGGER.error("Reauthentication failed after %d attempts", retry_count + 1)
-                        return None
-                    elif response.status >= 500:
-                        # Server error - retry with backoff
-                        if retry_count < max_retries:
-                            delay = base_delay * (2 ** retry_count)
-                            _LOGGER.warning("Server error HTTP %d, retrying in %ds (attempt %d/%d)",
-                                         response.status, delay, retry_count + 1, max_retries)
+                                    continue
+                            # Retry with backoff anyway
+                            _LOGGER.warning("Retrying after parse error in %.1fs...", delay)
                             await asyncio.sleep(delay)
-                            return await self.get_status(retry_count + 1)
-                        _LOGGER.error("Server error after %d retries", max_retries)
-                        return None
-                    else:
-                        _LOGGER.error("Failed to get status: HTTP %d", response.status)
+                            continue
+                        _LOGGER.error("XML parse error after %d retries: %s", max_retries, parse_error)
                         return None
-            except aiohttp.ClientError as e:
-                # Network error - retry with backoff
-                if retry_count < max_retries:
-                    delay = base_delay * (2 ** retry_count)
-                    _LOGGER.warning("Network error '%s', retrying in %ds (attempt %d/%d)",
-                                 e, delay, retry_count + 1, max_retries)
-                    await asyncio.sleep(delay)
-                    return await self.get_status(retry_count + 1)
-                _LOGGER.error("Network error after %d retries: %s", max_retries, e)
-                return None
+                elif status == 401 or status == 403:
+                    # Authentication error - try to reauthenticate
+                    _LOGGER.warning("Authentication error (HTTP %d), attempting reauthentication...",
+                                 status)
+                    if can_retry:
+                        await asyncio.sleep(delay)
+                        if await self._auth.authenticate():
+                            continue
+                    _LOGGER.error("Reauthentication failed after %d attempts", attempt + 1)
+                    return None
+                elif status >= 500:
+                    # Server error - retry with backoff
+                    if can_retry:
+                        _LOGGER.warning("Server error HTTP %d, retrying in %.1fs (attempt %d/%d)",
+                                     status, delay, attempt + 1, max_retries)
+                        await asyncio.sleep(delay)
+                        continue
+                    _LOGGER.error("Server error after %d retries", max_retries)
+                    return None
+                else:
+                    _LOGGER.error("Failed to get status: HTTP %d", status)
+                    return None
 
-        except asyncio.TimeoutError:
-            # Timeout - retry with backoff
-            if retry_count < max_retries:
-                delay = base_delay * (2 ** retry_count)
-                _LOGGER.warning("Timeout, retrying in %ds (attempt %d/%d)",
-                             delay, retry_count + 1, max_retries)
-                await asyncio.sleep(delay)
-                return await self.get_status(retry_count + 1)
-            _LOGGER.error("Timeout after %d retries", max_retries)
+            return None
+
+        except CombivoxCircuitOpenError:
+            _LOGGER.debug("Panel circuit opened during status retries, giving up")
             return None
 
         except Exception as e:
             _LOGGER.error("Unexpected error reading status: %s", e)
             return None
 
-    async def _get_status_unauthenticated(self, url: str, headers: dict) -> Optional[Dict[str, Any]]:
+    async def _get_status_unauthenticated(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get status without authentication (fallback).
 
+        Reuses the pooled client session: a failed login leaves its cookie jar
+        empty, so the request goes out without a session cookie.
+
         Args:
             url: Status URL
-            headers: HTTP headers
 
         Returns:
             Dict with status or None
         """
+        if self._auth.session is None:
+            _LOGGER.warning("No HTTP session available for unauthenticated status request")
+            return None
+
         try:
-            async with aiohttp.ClientSession() as temp_session:
-                async with temp_session.get(url, headers=headers, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        text = await response.text()
-                        return self._parse_status_response(text)
-                    else:
-                        _LOGGER.warning("Unauthenticated status request failed: HTTP %d", response.status)
-                        return None
+            async with self._request("GET", url) as response:
+                if response.status == 200:
+                    body = await response.read()
+                    return self._parse_status_response(body)
+                else:
+                    _LOGGER.warning("Unauthenticated status request failed: HTTP %d", response.status)
+                    return None
         except Exception as e:
             _LOGGER.warning("Unauthenticated status request error: %s", e)
             return None
 
-    def _parse_status_response(self, xml_text: str) -> Optional[Dict[str, Any]]:
+    def _parse_status_response(self, xml_text: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """Parse XML status response."""
         # Calculate max_areas dynamically from configured areas
         max_aree = len(self._areas_config) if self._areas_config else 8
 
-        return self._parser.parse_status_xml(
+        status = self._parser.parse_status_xml(
             xml_text,
             zones_config=self._zones_config,
             max_aree=max_aree,
             zone_ids=self._zone_ids  # Pass zone_ids from numZoneProg.xml
         )
+        return status
 
+    def _format_areas(self, areas: List[int]) -> str:
+        """Format area IDs for logging as "1(Casa), 2(Garage)" (O(1) name lookup using cache)."""
+        name_map = self._area_name_map
+        return ", ".join(f"{area_id}({name_map.get(area_id, area_id)})" for area_id in areas)
+
+    @_reauthenticate()
     async def arm_areas(self, areas: List[int], mode: str = "away", arm_mode: str = "normal") -> bool:
         """
         Arm the specified areas.
@@ -819,68 +1151,37 @@ class CombivoxWebClient:
             True if command sent successfully
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
             # Calculate max_areas dynamically
             max_aree = len(self._areas_config) if self._areas_config else 8
 
             # Calculate bIns0 value based on areas (BITMASK)
             # bit 0 = area 1, bit 1 = area 2, bit 2 = area 3, etc.
             # Example: areas [1,2,3] = bIns0 = 1|2|4 = 7
-            bIns0 = 0
-            for area in areas:
-                if 1 <= area <= max_aree:
-                    bIns0 |= (1 << (area - 1))
+            bIns0 = _areas_bitmask(areas, max_aree)
 
             # Map arm_mode to fIns value
-            # fIns=0 normale (ritardo)
-            # fIns=1 forzato (aree aperte)
-            # fIns=2 stay (no ritardo su zone con ritardo)
-            arm_mode_map = {
-                "normal": 0,
-                "immediate": 2,   # stay mode
-                "forced": 1
-            }
-            fIns = arm_mode_map.get(arm_mode, 0)
+            fIns = _ARM_MODE_TO_FINS.get(arm_mode, 0)
 
-            session = self._auth.get_session()
             url = f"{self.base_url}{INSAREA_URL}"
 
             # Build raw payload: bIns0=7&idc=49&fIns=0
             payload = f"bIns0={bIns0}&idc=49&fIns={fIns}"
 
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
-            _LOGGER.debug("Arm command: URL=%s, cookie=%s, payload=%s",
-                         url, cookie, payload)
+            _LOGGER.debug("Arm command: URL=%s, payload=%s", url, payload)
 
-            async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                response_text = await response.text()
+            async with self._request("POST", url, data=payload) as response:
+                response_text = (await response.read()).decode("utf-8", "replace")
 
                 _LOGGER.debug("Arm command response: status=%d, body=%s",
                              response.status, response_text)
 
                 if response.status == 200:
-                    # Build area names list for logging (O(1) lookup using cache)
-                    area_names = [
-                        f"{area_id}({self._area_name_map.get(area_id, area_id)})"
-                        for area_id in areas
-                    ]
+                    if _LOGGER.isEnabledFor(logging.INFO):
+                        # Map mode to display name
+                        mode_display = mode.capitalize() if mode else "Unknown"
 
-                    # Map mode to display name
-                    mode_display = mode.capitalize() if mode else "Unknown"
-
-                    _LOGGER.info("Areas armed (%s, %s): %s",
-                               mode_display, arm_mode, ", ".join(area_names))
+                        _LOGGER.info("Areas armed (%s, %s): %s",
+                                   mode_display, arm_mode, self._format_areas(areas))
                     return True
                 else:
                     _LOGGER.error("Arm command failed: HTTP %d, response=%s, payload=%s",
@@ -891,6 +1192,7 @@ class CombivoxWebClient:
             _LOGGER.error("Arm command error: %s", e)
             return False
 
+    @_reauthenticate()
     async def disarm_areas(self, areas: List[int]) -> bool:
         """
         Disarm the specified areas.
@@ -907,15 +1209,8 @@ class CombivoxWebClient:
             True if command sent successfully
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            # Get current status to check alarm state
+            # Get current status to check alarm state (still needed for a full disarm:
+            # a triggered panel must be disarmed via reqProg.cgi instead of insAree.xml)
             status_data = await self.get_status()
 
             # Check if panel is in triggered state
@@ -930,13 +1225,9 @@ class CombivoxWebClient:
                     success = await self._send_alarm_registration()
 
                     if success:
-                        # Build area names list for logging
                         if areas:
-                            area_names = [
-                                f"{area_id}({self._area_name_map.get(area_id, area_id)})"
-                                for area_id in areas
-                            ]
-                            _LOGGER.info("Areas disarmed via reqProg.cgi: %s", ", ".join(area_names))
+                            if _LOGGER.isEnabledFor(logging.INFO):
+                                _LOGGER.info("Areas disarmed via reqProg.cgi: %s", self._format_areas(areas))
                         else:
                             _LOGGER.info("All areas disarmed via reqProg.cgi")
                         return True
@@ -960,42 +1251,27 @@ class CombivoxWebClient:
                     remaining_armed = [area for area in currently_armed if area not in areas]
 
                     # Calculate bitmask of remaining armed areas
-                    bIns0 = 0
-                    for area_id in remaining_armed:
-                        if 1 <= area_id <= 32:
-                            bIns0 |= (1 << (area_id - 1))
+                    bIns0 = _areas_bitmask(remaining_armed)
 
                     _LOGGER.debug("Selective disarm - currently armed: %s, disarming: %s, remaining armed: %s (bitmask: %d)",
                                 currently_armed, areas, remaining_armed, bIns0)
 
-            session = self._auth.get_session()
             url = f"{self.base_url}{INSAREA_URL}"
 
             # Build raw payload: bIns0=BITMASK&idc=49&fIns=0
             payload = f"bIns0={bIns0}&idc=49&fIns=0"
 
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
+            _LOGGER.debug("Disarm command: URL=%s, payload=%s", url, payload)
 
-            _LOGGER.debug("Disarm command: URL=%s, cookie=%s, payload=%s",
-                         url, cookie, payload)
-
-            async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                response_text = await response.text()
+            async with self._request("POST", url, data=payload) as response:
+                response_text = (await response.read()).decode("utf-8", "replace")
 
                 _LOGGER.debug("Disarm command response: status=%d, body=%s",
                              response.status, response_text)
 
                 if response.status == 200:
-                    # Build area names list for logging (O(1) lookup using cache)
-                    area_names = [
-                        f"{area_id}({self._area_name_map.get(area_id, area_id)})"
-                        for area_id in areas
-                    ]
-
-                    _LOGGER.info("Areas disarmed: %s", ", ".join(area_names))
+                    if _LOGGER.isEnabledFor(logging.INFO):
+                        _LOGGER.info("Areas disarmed: %s", self._format_areas(areas))
                     return True
                 else:
                     _LOGGER.error("Disarm command failed: HTTP %d, response=%s, payload=%s",
@@ -1006,6 +1282,7 @@ class CombivoxWebClient:
             _LOGGER.error("Disarm command error: %s", e)
             return False
 
+    @_reauthenticate()
     async def toggle_zone_inclusion(self, zone_id: int) -> bool:
         """
         Toggle zone inclusion/exclusion (bypass).
@@ -1020,37 +1297,20 @@ class CombivoxWebClient:
             True if command sent successfully
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
             url = f"{self.base_url}/execBypass.xml"
 
             # nCmd = zone_id, idc = 49 (fixed parameter)
-            data = {
-                "nCmd": zone_id,
-                "idc": 49
-            }
-
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
+            data = f"nCmd={zone_id}&idc=49"
 
             _LOGGER.debug("Toggle zone inclusion: zone_id=%d", zone_id)
-            _LOGGER.debug("Toggle zone command: URL=%s, cookie=%s, payload=%s",
-                         url, cookie, data)
+            _LOGGER.debug("Toggle zone command: URL=%s, payload=%s", url, data)
 
-            async with session.post(url, headers=headers, data=data, timeout=self.timeout) as response:
-                response_text = await response.text()
+            async with self._request("POST", url, headers=self._form_headers, data=data) as response:
+                response_text = (await response.read()).decode("utf-8", "replace")
 
-                _LOGGER.debug("Toggle zone response: status=%d, body=%s",
-                             response.status, response_text[:200] if response_text else "None")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Toggle zone response: status=%d, body=%s",
+                                 response.status, response_text[:200] if response_text else "None")
 
                 if response.status == 200:
                     _LOGGER.info("Zone %d inclusion toggled successfully", zone_id)
@@ -1064,6 +1324,7 @@ class CombivoxWebClient:
             _LOGGER.error("Toggle zone command error: %s", e)
             return False
 
+    @_reauthenticate()
     async def clear_alarm_memory(self) -> bool:
         """
         Clear alarm memory.
@@ -1074,35 +1335,19 @@ class CombivoxWebClient:
             True if command sent successfully
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
             url = f"{self.base_url}{EXECDELMEM_URL}"
 
             # Payload: comandi=del
-            data = {
-                "comandi": "del"
-            }
+            data = _CLEAR_MEM_PAYLOAD
 
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
+            _LOGGER.debug("Clear alarm memory command: URL=%s, payload=%s", url, data)
 
-            _LOGGER.debug("Clear alarm memory command: URL=%s, cookie=%s, payload=%s",
-                         url, cookie, data)
+            async with self._request("POST", url, headers=self._form_headers, data=data) as response:
+                response_text = (await response.read()).decode("utf-8", "replace")
 
-            async with session.post(url, headers=headers, data=data, timeout=self.timeout) as response:
-                response_text = await response.text()
-
-                _LOGGER.debug("Clear alarm memory response: status=%d, body=%s",
-                             response.status, response_text[:200] if response_text else "None")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Clear alarm memory response: status=%d, body=%s",
+                                 response.status, response_text[:200] if response_text else "None")
 
                 if response.status == 200:
                     _LOGGER.info("Alarm memory cleared successfully")
@@ -1116,6 +1361,7 @@ class CombivoxWebClient:
             _LOGGER.error("Clear alarm memory command error: %s", e)
             return False
 
+    @_reauthenticate()
     async def _send_alarm_registration(self) -> bool:
         """
         Send alarm registration request to reqProg.cgi when panel is in alarm state.
@@ -1143,16 +1389,7 @@ class CombivoxWebClient:
             False if failed after all retries
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
-            if not session:
+            if not self._auth.session:
                 _LOGGER.error("No HTTP session available")
                 return False
 
@@ -1161,30 +1398,26 @@ class CombivoxWebClient:
             current_hash = None
 
             for attempt in range(1, max_req255_retries + 1):
-                # Generate new hash for each req=255 attempt
+                # Generate new hash for each req=255 attempt: a retry follows a RESEND (or
+                # unexpected reply), so the previous hash must never be reused
                 b64_auth = self._auth.generate_auth_for_command(username="combivox")
                 current_hash = b64_auth
 
                 basic_value = f"Basic={b64_auth}"
                 payload = f"txt_zip={basic_value}&hTxt={basic_value}&ncc=6"
-
-                headers = {}
-                cookie = self._auth.get_cookie()
-                if cookie:
-                    headers["Cookie"] = cookie
-                headers["Referer"] = f"{self.base_url}/index.htm?id=10&req=0"
-                headers["Content-Type"] = "text/plain;charset=UTF-8"
+                headers = self._reqprog_headers
 
                 url = f"{self.base_url}{REQPROG_URL}?req=255"
 
-                _LOGGER.debug("Phase 1 attempt %d/%d: POST req=255 with hash %s...",
-                             attempt, max_req255_retries, current_hash[:20] if current_hash else "None")
+                _LOGGER.debug("Phase 1 attempt %d/%d: POST req=255 with hash %.20s...",
+                             attempt, max_req255_retries, current_hash)
 
-                async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                    response_text = await response.text()
+                async with self._request("POST", url, headers=headers, data=payload) as response:
+                    response_text = (await response.read()).decode("utf-8", "replace")
 
-                    _LOGGER.debug("Response: status=%d, body=%s",
-                                 response.status, response_text[:100] if response_text else "None")
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Response: status=%d, body=%s",
+                                     response.status, response_text[:100] if response_text else "None")
 
                     # Check response
                     if response_text and "REDIRECT" in response_text:
@@ -1219,24 +1452,19 @@ class CombivoxWebClient:
             for attempt in range(1, max_req0_retries + 1):
                 basic_value = f"Basic={current_hash}"
                 payload = f"txt_zip={basic_value}&hTxt={basic_value}&ncc=6"
-
-                headers = {}
-                cookie = self._auth.get_cookie()
-                if cookie:
-                    headers["Cookie"] = cookie
-                headers["Referer"] = f"{self.base_url}/index.htm?id=10&req=0"
-                headers["Content-Type"] = "text/plain;charset=UTF-8"
+                headers = self._reqprog_headers
 
                 url = f"{self.base_url}{REQPROG_URL}?req=0"
 
-                _LOGGER.debug("Phase 2 attempt %d/%d: POST req=0 with SAME hash %s...",
-                             attempt, max_req0_retries, current_hash[:20])
+                _LOGGER.debug("Phase 2 attempt %d/%d: POST req=0 with SAME hash %.20s...",
+                             attempt, max_req0_retries, current_hash)
 
-                async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                    response_text = await response.text()
+                async with self._request("POST", url, headers=headers, data=payload) as response:
+                    response_text = (await response.read()).decode("utf-8", "replace")
 
-                    _LOGGER.debug("Response: status=%d, body=%s",
-                                 response.status, response_text[:100] if response_text else "None")
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Response: status=%d, body=%s",
+                                     response.status, response_text[:100] if response_text else "None")
 
                     # Check response
                     if response_text and "REDIRECT" in response_text:
@@ -1264,6 +1492,7 @@ class CombivoxWebClient:
             _LOGGER.error("Error in alarm registration sequence: %s", e)
             return False
 
+    @_reauthenticate()
     async def execute_macro(self, macro_id: int, macro_name: str = None) -> bool:
         """
         Execute a macro (scenario).
@@ -1279,20 +1508,7 @@ class CombivoxWebClient:
             True if command executed successfully (<nc>31</nc> in response)
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-            headers["Referer"] = f"{self.base_url}/index.htm?id=2"
+            headers = self._referer_index2
 
             # Execute macro via POST to execChangeImp.xml?id=2
             url = f"{self.base_url}/execChangeImp.xml?id=2"
@@ -1302,40 +1518,47 @@ class CombivoxWebClient:
             _LOGGER.debug("Execute macro %d %s: URL=%s, payload=%s",
                          macro_id, macro_desc, url, payload)
 
-            async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                response_text = await response.text()
-                _LOGGER.debug("Response: status=%d, body=%s",
-                             response.status, response_text[:200] if response_text else "None")
+            async with self._request("POST", url, headers=headers, data=payload) as response:
+                body = await response.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response: status=%d, body=%s",
+                                 response.status, body[:200].decode(errors="replace") if body else "None")
 
                 if response.status == 200:
-                    # Parse XML response: <nc>31</nc> means success
-                    if "<nc>" in response_text:
-                        try:
-                            import re
-                            nc_match = re.search(r'<nc>(\d+)</nc>', response_text)
-                            if nc_match:
-                                nc_value = int(nc_match.group(1))
-                                if nc_value == MACRO_SUCCESS_CODE:  # 0x31 = success
-                                    _LOGGER.debug("Macro %d %s executed successfully", macro_id, macro_desc)
-                                    return True
-                                else:
-                                    _LOGGER.warning("Macro returned unexpected code: %d (expected %d)", nc_value, MACRO_SUCCESS_CODE)
-                                    return False
-                        except (ValueError, AttributeError):
-                            _LOGGER.warning("Could not parse result code from XML response")
-                            return False
-                    else:
+                    # Fast path: <nc>31</nc> means success
+                    if _MACRO_OK in body:
+                        _LOGGER.debug("Macro %d %s executed successfully", macro_id, macro_desc)
+                        return True
+
+                    # Otherwise extract <nc> to report the actual code (tiny fixed-shape
+                    # body, so plain find + slice instead of a regex)
+                    response_text = body.decode(errors="replace")
+                    start = response_text.find("<nc>")
+                    end = response_text.find("</nc>", start + 4) if start >= 0 else -1
+                    if end < 0:
                         _LOGGER.warning("Macro response does not contain <nc> tag")
                         return False
+                    try:
+                        nc_value = int(response_text[start + 4:end])
+                    except ValueError:
+                        _LOGGER.warning("Could not parse result code from XML response")
+                        return False
+                    if nc_value == MACRO_SUCCESS_CODE:  # 0x31 = success
+                        _LOGGER.debug("Macro %d %s executed successfully", macro_id, macro_desc)
+                        return True
+                    else:
+                        _LOGGER.warning("Macro returned unexpected code: %d (expected %d)", nc_value, MACRO_SUCCESS_CODE)
+                        return False
                 else:
                     _LOGGER.error("Macro command failed: HTTP %d, response=%s, payload=%s",
-                                response.status, response_text[:200] if response_text else "None", payload)
+                                response.status, body[:200].decode(errors="replace") if body else "None", payload)
                     return False
 
         except Exception as e:
             _LOGGER.error("Execute macro error: %s", e)
             return False
 
+    @_reauthenticate()
     async def execute_command(self, command_id: int, activate: bool = True) -> bool:
         """
         Execute a command (button or switch).
@@ -1353,20 +1576,7 @@ class CombivoxWebClient:
             True if command executed successfully
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return False
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-            headers["Referer"] = f"{self.base_url}/index.htm?id=6"
+            headers = self._referer_index6
 
             # val=7 to activate, val=0 to deactivate
             val = 7 if activate else 0
@@ -1377,10 +1587,11 @@ class CombivoxWebClient:
             _LOGGER.debug("Execute command %d (%s): URL=%s, payload=%s",
                          command_id, action, url, payload)
 
-            async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                response_text = await response.text()
-                _LOGGER.debug("Response: status=%d, body=%s",
-                             response.status, response_text[:200] if response_text else "None")
+            async with self._request("POST", url, headers=headers, data=payload) as response:
+                response_text = (await response.read()).decode("utf-8", "replace")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response: status=%d, body=%s",
+                                 response.status, response_text[:200] if response_text else "None")
 
                 if response.status == 200:
                     # TODO: Parse response to verify success (currently no response format known)
@@ -1395,18 +1606,26 @@ class CombivoxWebClient:
             _LOGGER.error("Execute command error: %s", e)
             return False
 
-    def get_zones_config(self) -> List[Dict[str, Any]]:
+    def get_zones_config(self) -> List[CombivoxZone]:
         """Return the zones configuration."""
         return self._zones_config
 
-    def get_areas_config(self) -> List[Dict[str, Any]]:
+    def get_areas_config(self) -> List[CombivoxArea]:
         """Return the areas configuration."""
         return self._areas_config
 
+    def get_all_area_ids(self) -> Tuple[int, ...]:
+        """Return all configured area IDs (areas 1-8 if no areas config is loaded)."""
+        return self._all_area_ids or _DEFAULT_AREA_IDS
+
     def get_macros_config(self) -> List[Dict[str, Any]]:
         """Return the macros (scenarios) configuration."""
         return self._macros_config
 
+    def get_macro_name(self, macro_id: int) -> str:
+        """Return the name of a macro (scenario), or "Unknown" if not configured."""
+        return self._macro_name_map.get(macro_id, "Unknown")
+
     def get_commands_config(self) -> List[Dict[str, Any]]:
         """Return the commands configuration."""
         return self._commands_config
@@ -1447,33 +1666,26 @@ class CombivoxWebClient:
         Returns:
             None (updates self._device_info["variant"])
         """
-        import re
-
         try:
             # Get authenticated session
-            session = self._auth.get_session()
-            if not session:
+            if not self._auth.session:
                 _LOGGER.warning("No session available for device info fetch")
                 return
 
-            # Build headers with cookie (same as labelProgStato.xml and other requests)
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
             url = f"{self.base_url}{JSCRIPT9_URL}"
             _LOGGER.debug("Fetching device info from %s", url)
 
-            async with session.get(url, headers=headers, timeout=self.timeout) as response:
+            async with self._request("GET", url) as response:
                 if response.status != 200:
                     _LOGGER.warning("Failed to fetch jscript9.js: status %d", response.status)
                     return
 
-                js_content = await response.text()
+                # Read the whole body so the keep-alive connection goes back to the pool
+                # (latin-1 never fails, and the values searched below are plain ASCII)
+                js_content = (await response.read()).decode("latin-1")
 
             # Extract vertype - handles both single and double quotes
-            vertype_match = re.search(r'var\s+vertype\s*=\s*["\']([^"\']+)["\']', js_content)
+            vertype_match = _VERTYPE_RE.search(js_content)
             if not vertype_match:
                 _LOGGER.warning("Could not find vertype in jscript9.js")
                 _LOGGER.debug("Content length: %d bytes, first 200 chars: %s", len(js_content), js_content[:200])
@@ -1483,7 +1695,7 @@ class CombivoxWebClient:
             _LOGGER.debug("Found vertype: %s", vertype)
 
             # Extract typWeb - handles both single and double quotes
-            typweb_match = re.search(r'var\s+typWeb\s*=\s*["\']([^"\']+)["\']', js_content)
+            typweb_match = _TYPWEB_RE.search(js_content)
             typweb = typweb_match.group(1).strip() if typweb_match else None
             _LOGGER.debug("Found typWeb: %s", typweb)
 
@@ -1492,8 +1704,8 @@ class CombivoxWebClient:
             vertype_upper = vertype.upper()
 
             # Fix AMICA → Amica, ELISA → Elisa
-            vertype_upper = re.sub(r'\bAMICA\b', 'Amica', vertype_upper)
-            vertype_upper = re.sub(r'\bELISA\b', 'Elisa', vertype_upper)
+            vertype_upper = _AMICA_RE.sub('Amica', vertype_upper)
+            vertype_upper = _ELISA_RE.sub('Elisa', vertype_upper)
 
             # Rule 2: If contains both "LTE" and "GSM", remove "GSM"
             if "LTE" in vertype_upper and "GSM" in vertype_upper:
@@ -1530,6 +1742,7 @@ class CombivoxWebClient:
         except Exception as e:
             _LOGGER.warning("Error fetching device info: %s", e)
 
+    @_reauthenticate(None)
     async def get_anomalies_info(self) -> Optional[int]:
         """
         Get active anomaly/trouble ID from the panel.
@@ -1538,50 +1751,36 @@ class CombivoxWebClient:
             Active anomaly ID (0-15) from numTrouble.xml c0, or None if no anomaly
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return None
-                _LOGGER.info("Reauthentication successful")
-
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
-
             # Get active anomaly ID from numTrouble.xml
             url = f"{self.base_url}{NUMTROUBLE_URL}"
-            async with session.get(url, headers=headers, timeout=self.timeout) as response:
+            async with self._request("GET", url) as response:
                 if response.status != 200:
                     _LOGGER.error("Failed to get numTrouble: HTTP %d", response.status)
                     return None
 
-                xml_content = await response.text()
-                _LOGGER.debug("numTrouble.xml response: %s", xml_content[:200])
+                body = await response.read()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("numTrouble.xml response: %s", body[:200].decode(errors="replace"))
 
-                # Parse active anomaly ID from <c0>id</c0>
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(xml_content)
-                c0_elem = root.find("c0")
-                if c0_elem is None or not c0_elem.text:
-                    _LOGGER.warning("No c0 element in numTrouble.xml")
-                    return None
+            # Parse active anomaly ID from <c0>id</c0>
+            c0_text = self._parser.parse_c0_text(body)
+            if c0_text is None:
+                _LOGGER.warning("No c0 element in numTrouble.xml")
+                return None
 
-                try:
-                    anomaly_id = int(c0_elem.text.strip())
-                    _LOGGER.info("Retrieved active anomaly ID: %d", anomaly_id)
-                    return anomaly_id
-                except ValueError:
-                    _LOGGER.error("Invalid anomaly ID: %s", c0_elem.text)
-                    return None
+            try:
+                anomaly_id = int(c0_text)
+                _LOGGER.info("Retrieved active anomaly ID: %d", anomaly_id)
+                return anomaly_id
+            except ValueError:
+                _LOGGER.error("Invalid anomaly ID: %s", c0_text)
+                return None
 
         except Exception as e:
             _LOGGER.error("Error getting anomalies info: %s", e)
             return None
 
+    @_reauthenticate([])
     async def get_alarm_memory_info(self) -> List[Dict[str, Any]]:
         """
         Get alarm memory information from the panel.
@@ -1590,84 +1789,113 @@ class CombivoxWebClient:
             List of alarm memory entries with id and message
         """
         try:
-            # Reauthenticate if not authenticated
-            if not self._auth.is_authenticated():
-                _LOGGER.warning("Not authenticated, attempting reauthentication...")
-                if not await self._auth.authenticate():
-                    _LOGGER.error("Reauthentication failed")
-                    return []
-                _LOGGER.info("Reauthentication successful")
+            cached_id = self._last_memory_id
+            if cached_id is not None:
+                # The memory ID is usually stable between calls: request its label
+                # together with numMemProg.xml instead of waiting for the fresh ID
+                memory_count, body = await asyncio.gather(
+                    self._fetch_alarm_memory_id(),
+                    self._fetch_alarm_memory_label(cached_id),
+                )
+                if memory_count != cached_id:
+                    body = None  # Stale guess: the label must match the fresh ID
+            else:
+                memory_count = await self._fetch_alarm_memory_id()
+                body = None
 
-            session = self._auth.get_session()
-            headers = {}
-            cookie = self._auth.get_cookie()
-            if cookie:
-                headers["Cookie"] = cookie
+            if memory_count is None:
+                return []
+            self._last_memory_id = memory_count
 
-            # Step 1: Get number of alarm memories
-            url = f"{self.base_url}{NUMMEMPROG_URL}"
-            async with session.get(url, headers=headers, timeout=self.timeout) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to get numMemProg: HTTP %d", response.status)
+            if body is None:
+                body = await self._fetch_alarm_memory_label(memory_count)
+                if body is None:
                     return []
 
-                xml_content = await response.text()
-                _LOGGER.debug("numMemProg.xml response: %s", xml_content[:200])
+            # Parse alarm memory label
+            hex_text = self._parser.parse_alarm_memory_hex(body, memory_count)
+            if hex_text is None:
+                _LOGGER.warning("No m%s element in labelMem.xml", memory_count)
+                return []
 
-                # Parse number of memories from <c0>count</c0>
-                import xml.etree.ElementTree as ET
-                root = ET.fromstring(xml_content)
-                c0_elem = root.find("c0")
-                if c0_elem is None or not c0_elem.text:
-                    _LOGGER.warning("No c0 element in numMemProg.xml")
-                    return []
+            cached_label = self._memory_label_cache
+            if cached_label is not None and cached_label[0] == memory_count and cached_label[1] == hex_text:
+                # Same entry as last time: reuse the decoded message
+                message = cached_label[2]
+            else:
+                # Convert hex to text, rejecting malformed hex up front (invalid UTF-8
+                # bytes are replaced rather than raising)
+                if len(hex_text) % 2 == 0 and _HEX_DIGITS.issuperset(hex_text):
+                    message = bytes.fromhex(hex_text).decode('utf-8', 'replace')
+                else:
+                    _LOGGER.error("Invalid hex in alarm memory label: %s", hex_text[:50])
+                    message = hex_text  # Fallback to raw hex
+                self._memory_label_cache = (memory_count, hex_text, message)
+
+            alarm_memory = [{
+                "id": memory_count,
+                "message": message
+            }]
 
-                memory_count = c0_elem.text.strip()
-                _LOGGER.debug("Alarm memory count: %s", memory_count)
+            _LOGGER.info("Retrieved alarm memory: %s", message)
+            return alarm_memory
 
-                # If memory_count is just the count as integer, we need to get individual IDs
-                # For now, assume it's the actual ID (like "1058")
-                # If it's a count, we would need to iterate and get each label
+        except Exception as e:
+            _LOGGER.error("Error getting alarm memory info: %s", e)
+            return []
 
-            # Step 2: Get alarm memory label
-            url = f"{self.base_url}{LABELMEM_URL}"
-            payload = f"comandi={memory_count};"
+    async def _fetch_alarm_memory_id(self) -> Optional[str]:
+        """
+        Read the alarm memory ID from numMemProg.xml (<c0>).
 
-            async with session.post(url, headers=headers, data=payload, timeout=self.timeout) as response:
-                if response.status != 200:
-                    _LOGGER.error("Failed to get labelMem: HTTP %d", response.status)
-                    return []
+        Returns:
+            Memory ID (like "1058"), or None if the request or the response failed
+        """
+        url = f"{self.base_url}{NUMMEMPROG_URL}"
+        async with self._request("GET", url) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to get numMemProg: HTTP %d", response.status)
+                return None
 
-                xml_content = await response.text()
-                _LOGGER.debug("labelMem.xml response: %s", xml_content[:200])
+            body = await response.read()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("numMemProg.xml response: %s", body[:200].decode(errors="replace"))
 
-                # Parse alarm memory label
-                root = ET.fromstring(xml_content)
-                mem_tag = root.find(f"m{memory_count}")
-                if mem_tag is None or not mem_tag.text:
-                    _LOGGER.warning("No m%s element in labelMem.xml", memory_count)
-                    return []
+        # Parse number of memories from <c0>count</c0>
+        memory_count = self._parser.parse_c0_text(body)
+        if memory_count is None:
+            _LOGGER.warning("No c0 element in numMemProg.xml")
+            return None
 
-                hex_text = mem_tag.text.strip()
+        _LOGGER.debug("Alarm memory count: %s", memory_count)
 
-                # Convert hex to ASCII using bytes.fromhex().decode()
-                try:
-                    message = bytes.fromhex(hex_text).decode('utf-8')
-                except Exception as e:
-                    _LOGGER.error("Error converting hex to ASCII: %s", e)
-                    message = hex_text  # Fallback to raw hex
+        # If memory_count is just the count as integer, we need to get individual IDs
+        # For now, assume it's the actual ID (like "1058")
+        # If it's a count, we would need to iterate and get each label
+        return memory_count
 
-                alarm_memory = [{
-                    "id": memory_count,
-                    "message": message
-                }]
+    async def _fetch_alarm_memory_label(self, memory_id: str) -> Optional[bytes]:
+        """
+        Download the labelMem.xml response for an alarm memory ID.
 
-                _LOGGER.info("Retrieved alarm memory: %s", message)
-                return alarm_memory
+        Args:
+            memory_id: Alarm memory ID from numMemProg.xml
 
-        except Exception as e:
-            _LOGGER.error("Error getting alarm memory info: %s", e)
-            return []
+        Returns:
+            Raw XML body, or None on HTTP error
+        """
+        url = f"{self.base_url}{LABELMEM_URL}"
+        payload = f"comandi={memory_id};"
+
+        async with self._request("POST", url, data=payload) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to get labelMem: HTTP %d", response.status)
+                return None
+
+            body = await response.read()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("labelMem.xml response: %s", body[:200].decode(errors="replace"))
+        return body
 
     async def close(self):
         """Close the connection."""
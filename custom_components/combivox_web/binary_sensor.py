@@ -13,7 +13,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .base import CombivoxWebClient
-from .const import DOMAIN, DATA_COORDINATOR, DATA_CONFIG
 from .coordinator import CombivoxDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,8 +27,8 @@ async def async_setup_entry(
     _LOGGER.info("Setting up binary sensors")
 
     # Get coordinator and client
-    coordinator: CombivoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    client: CombivoxWebClient = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+    coordinator: CombivoxDataUpdateCoordinator = entry.runtime_data.coordinator
+    client: CombivoxWebClient = entry.runtime_data.client
 
     # Get device info for HA
     device_info = client.get_device_info_for_ha()
@@ -39,8 +38,8 @@ async def async_setup_entry(
     # Add zone sensors
     zones_config = client.get_zones_config()
     for zone_config in zones_config:
-        zone_id = zone_config.get("zone_id")
-        zone_name = zone_config.get("zone_name", f"Zone {zone_id}")
+        zone_id = zone_config.zone_id
+        zone_name = zone_config.zone_name or f"Zone {zone_id}"
 
         entity = CombivoxZoneBinarySensor(
             zone_id=zone_id,
@@ -54,8 +53,8 @@ async def async_setup_entry(
     # Add area sensors
     areas_config = client.get_areas_config()
     for area_config in areas_config:
-        area_id = area_config.get("area_id")
-        area_name = area_config.get("area_name", f"Area {area_id}")
+        area_id = area_config.area_id
+        area_name = area_config.area_name or f"Area {area_id}"
 
         entity = CombivoxAreaBinarySensor(
             area_id=area_id,
@@ -11,7 +11,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .base import CombivoxWebClient
-from .const import DOMAIN, DATA_COORDINATOR, DATA_CONFIG
 from .coordinator import CombivoxDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,8 +25,8 @@ async def async_setup_entry(
     _LOGGER.info("Setting up zone bypass and macro buttons")
 
     # Get coordinator and client
-    coordinator: CombivoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    client: CombivoxWebClient = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+    coordinator: CombivoxDataUpdateCoordinator = entry.runtime_data.coordinator
+    client: CombivoxWebClient = entry.runtime_data.client
 
     # Get device info for HA
     device_info = client.get_device_info_for_ha()
@@ -43,8 +42,8 @@ async def async_setup_entry(
     # Create a button for each zone that has a name
     if zones_config:
         for zone in zones_config:
-            zone_name = zone.get("zone_name")
-            zone_id = zone.get("zone_id")
+            zone_name = zone.zone_name
+            zone_id = zone.zone_id
 
             # Only create buttons for zones with names
             if zone_name:
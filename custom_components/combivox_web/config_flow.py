@@ -1,5 +1,6 @@
 """Config flow for Combivox Amica Web integration."""
 
+import json
 import logging
 import os
 from typing import Any, Dict
@@ -239,8 +240,6 @@ class CombivoxOptionsFlowHandler(config_entries.OptionsFlow):
                 _LOGGER.warning("Config file not found: %s", config_file_path)
                 return
 
-            import json
-
             # Use async_executor to avoid blocking the event loop
             def _read_json():
                 with open(config_file_path, 'r', encoding='utf-8') as f:
@@ -269,8 +268,6 @@ class CombivoxOptionsFlowHandler(config_entries.OptionsFlow):
                 _LOGGER.debug("Config file not found: %s", config_file_path)
                 return
 
-            import json
-
             # Use async_executor to avoid blocking the event loop
             def _read_json():
                 with open(config_file_path, 'r', encoding='utf-8') as f:
@@ -152,8 +152,3 @@ DOMOTIC_MODULE_HEX_TO_STATE = {
 # First command ID for domotic modules (adjust if your panel uses different IDs)
 DOMOTIC_MODULE_FIRST_COMMAND_ID = 145  # Module 0 = commands 145-146, module 1 = 147-148, etc.
 # Change to 81 if your domotic modules start from command 81
-
-# Data keys
-DATA_COORDINATOR = "coordinator"
-DATA_UPDATE_LISTENER = "update_listener"
-DATA_CONFIG = "config"
@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -11,10 +12,44 @@ from homeassistant.helpers.event import async_track_time_interval
 
 from .base import CombivoxWebClient
 from .const import DEFAULT_SCAN_INTERVAL
+from .exceptions import CombivoxConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class CombivoxRuntimeData:
+    """Runtime objects stored for each config entry."""
+
+    coordinator: "CombivoxDataUpdateCoordinator"
+    client: CombivoxWebClient
+    config_file_path: Optional[str] = None
+    alarm_panel_entity: Any = None
+    options_fingerprint: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CombivoxOptionsSnapshot:
+    """Immutable snapshot of the alarm panel options (areas, macros, arm modes)."""
+
+    areas_away: Tuple[int, ...] = ()
+    areas_home: Tuple[int, ...] = ()
+    areas_night: Tuple[int, ...] = ()
+    areas_custom_bypass: Tuple[int, ...] = ()
+    areas_disarm: Tuple[int, ...] = ()
+    macro_away: str = ""
+    macro_home: str = ""
+    macro_night: str = ""
+    macro_custom_bypass: str = ""
+    macro_disarm: str = ""
+    arm_mode_away: str = "normal"
+    arm_mode_home: str = "normal"
+    arm_mode_night: str = "normal"
+    arm_mode_custom_bypass: str = "normal"
+    enable_bypass: bool = False
+    scan_interval: Optional[int] = None
+
+
 class CombivoxDataUpdateCoordinator(DataUpdateCoordinator):
     """Unified data update coordinator for polling all panel data."""
 
@@ -142,7 +177,6 @@ class CombivoxDataUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("Panel unavailable after %d consecutive failures - marking entities unavailable",
                                 self._consecutive_failures)
                     self._panel_unavailable = True
-                    from .exceptions import CombivoxConnectionError
                     raise CombivoxConnectionError(f"Panel unavailable after {self._consecutive_failures} consecutive failures")
                 else:
                     # Return last known data but don't mark as unavailable yet
@@ -162,7 +196,6 @@ class CombivoxDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Panel unavailable after %d consecutive failures - marking entities unavailable",
                             self._consecutive_failures)
                 self._panel_unavailable = True
-                from .exceptions import CombivoxConnectionError
                 raise CombivoxConnectionError(f"Panel unavailable after {self._consecutive_failures} consecutive failures")
             else:
                 return self.data if self.data else {"state": "unknown", "zones": {}, "areas": {}}
@@ -1,13 +1,15 @@
 """Diagnostics support for Combivox Amica Web."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import asdict
 from typing import Any, Dict
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, TROUBLE_ID_TO_DESCRIPTION
+from .const import TROUBLE_ID_TO_DESCRIPTION
 from .base import CombivoxWebClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,8 +24,9 @@ async def async_get_config_entry_diagnostics(
 
     try:
         # Get client and coordinator
-        client: CombivoxWebClient = hass.data[DOMAIN][config_entry.entry_id]["config"]
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        runtime = config_entry.runtime_data
+        client: CombivoxWebClient = runtime.client
+        coordinator = runtime.coordinator
 
         # Filter sensitive data from config_entry_data (remove code)
         filtered_data = dict(config_entry.data)
@@ -36,7 +39,7 @@ async def async_get_config_entry_diagnostics(
                 "ip_address": client.ip_address,
                 "port": client.port,
                 "base_url": client.base_url,
-                "timeout": client.timeout,
+                "timeout": client.timeout.total,
             },
             "coordinator": {
                 "update_interval": str(coordinator.update_interval),
@@ -61,17 +64,12 @@ async def async_get_config_entry_diagnostics(
             # Add zones info (summary only)
             zones = coordinator.data.get("zones", {})
             if zones:
-                # Get zone names from config (zones_config is a list of dicts with "id" and "name")
+                # Get zone names from config
+                zone_names = {zc.zone_id: zc.zone_name for zc in zones_config}
                 zones_with_alarm = []
                 for zid, zdata in zones.items():
                     if zdata.get("alarm_memory"):
-                        # Find zone config by matching id
-                        zone_config = None
-                        for zc in zones_config:
-                            if zc.get("id") == zid:
-                                zone_config = zc
-                                break
-                        zone_name = zone_config.get("name") if zone_config else None
+                        zone_name = zone_names.get(zid)
                         zones_with_alarm.append({
                             "zone_id": zid,
                             "zone_name": zone_name
@@ -119,7 +117,7 @@ async def async_get_config_entry_diagnostics(
             "zones_count": len(client.get_zones_config()),
             "areas_count": len(areas_config),
             "macros_count": len(macros_config),
-            "areas": areas_config,
+            "areas": [asdict(area) for area in areas_config],
             "macros": macros_config,
             "alarm_control_panel_config": {
                 "away_uses_macro": bool(config_entry.options.get("conf_macro_away")),
@@ -137,9 +135,18 @@ async def async_get_config_entry_diagnostics(
                 "variant": device_info.get("variant"),
             }
 
-        # Fetch active anomaly and add to anomalies section
+        # Active anomaly and alarm memory are independent panel reads: fetch them concurrently
+        anomaly_result, alarm_memory_result = await asyncio.gather(
+            client.get_anomalies_info(),
+            client.get_alarm_memory_info(),
+            return_exceptions=True,
+        )
+
+        # Add active anomaly to anomalies section
         try:
-            anomaly_id = await client.get_anomalies_info()
+            if isinstance(anomaly_result, Exception):
+                raise anomaly_result
+            anomaly_id = anomaly_result
             # Ensure anomalies section exists
             if "anomalies" not in diagnostic_data:
                 diagnostic_data["anomalies"] = {}
@@ -159,9 +166,11 @@ async def async_get_config_entry_diagnostics(
                 diagnostic_data["anomalies"] = {}
             diagnostic_data["anomalies"]["error"] = str(e)
 
-        # Fetch and add alarm memory info
+        # Add alarm memory info
         try:
-            alarm_memory = await client.get_alarm_memory_info()
+            if isinstance(alarm_memory_result, Exception):
+                raise alarm_memory_result
+            alarm_memory = alarm_memory_result
             diagnostic_data["alarm_memory"] = {
                 "count": len(alarm_memory),
                 "entries": alarm_memory,
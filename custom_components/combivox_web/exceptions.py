@@ -23,5 +23,9 @@ class CombivoxAuthenticationError(CombivoxConnectionError):
     """Authentication failed."""
 
 
+class CombivoxCircuitOpenError(CombivoxConnectionError):
+    """Request skipped because the panel failed repeatedly (circuit breaker open)."""
+
+
 class CombivoxParseError(CombivoxError):
     """XML or data parsing error."""
@@ -12,7 +12,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .base import CombivoxWebClient
 from .const import (
-    DOMAIN, DATA_COORDINATOR, DATA_CONFIG,
     GSM_STATUS_HEX_TO_HA_STATE,
     GSM_OPERATOR_HEX_TO_NAME,
     ANOMALIES_HEX_TO_HA_STATE
@@ -31,8 +30,8 @@ async def async_setup_entry(
     _LOGGER.info("Setting up system sensors")
 
     # Get coordinator and client
-    coordinator: CombivoxDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
-    client: CombivoxWebClient = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+    coordinator: CombivoxDataUpdateCoordinator = entry.runtime_data.coordinator
+    client: CombivoxWebClient = entry.runtime_data.client
 
     # Get device info for HA
     device_info = client.get_device_info_for_ha()
@@ -123,7 +122,7 @@ class CombivoxDateTimeSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> str | None:
         """Return the device date and time."""
         # Read from coordinator that has already done the parsing
-        system_data = self.coordinator.data
+        system_data = self.coordinator.data or {}
 
         dt = system_data.get("datetime")
 
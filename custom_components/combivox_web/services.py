@@ -8,7 +8,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, DATA_CONFIG, DATA_COORDINATOR
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ async def setup_services(hass: HomeAssistant) -> None:
             return {"success": False}
 
         entry = next(iter(entries))
-        client = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+        client = entry.runtime_data.client
 
         # Call async arm_areas method
         # mode parameter is only used for logging, arm_mode determines the actual behavior
@@ -69,7 +69,7 @@ async def setup_services(hass: HomeAssistant) -> None:
 
         if success:
             # Refresh coordinator
-            coordinator = hass.data[DOMAIN][entry.entry_id].get(DATA_COORDINATOR)
+            coordinator = entry.runtime_data.coordinator
             if coordinator:
                 await coordinator.async_request_refresh()
 
@@ -113,14 +113,14 @@ async def setup_services(hass: HomeAssistant) -> None:
             return {"success": False}
 
         entry = next(iter(entries))
-        client = hass.data[DOMAIN][entry.entry_id][DATA_CONFIG]
+        client = entry.runtime_data.client
 
         # Call async disarm_areas method
         success = await client.disarm_areas(areas)
 
         if success:
             # Refresh coordinator
-            coordinator = hass.data[DOMAIN][entry.entry_id].get(DATA_COORDINATOR)
+            coordinator = entry.runtime_data.coordinator
             if coordinator:
                 await coordinator.async_request_refresh()
 
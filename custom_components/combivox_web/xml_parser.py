@@ -3,12 +3,72 @@
 import xml.etree.ElementTree as ET
 import logging
 import datetime
-from typing import Dict, List, Optional, Any
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
-from .const import ALARM_HEX_TO_AP_STATE
+import aiohttp
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # lxml is optional, the standard library parser is always available
+    _lxml_etree = None
+
+from .const import ALARM_HEX_TO_AP_STATE, DOMOTIC_MODULE_FIRST_COMMAND_ID, DOMOTIC_MODULE_HEX_TO_STATE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Backend used for complete raw documents ("lxml" when installed)
+PARSER_BACKEND = "lxml" if _lxml_etree is not None else "xml.etree"
+
+# Shared lxml parser for panel bodies (no entity expansion, no network access)
+_LXML_PARSER = (
+    _lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+    if _lxml_etree is not None else None
+)
+
+# Single-value responses (numTrouble.xml, numMemProg.xml): <c0> read without building a tree
+_C0_RE = re.compile(rb"<c0>\s*([^<\s]+)\s*</c0>")
+
+# Chunk size (bytes) when streaming an HTTP body into a pull parser
+_STREAM_CHUNK_SIZE = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class CombivoxZone:
+    """Configured zone (from labelProgStato.xml)."""
+
+    zone_id: int
+    zone_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class CombivoxArea:
+    """Configured area (from labelProgStato.xml)."""
+
+    area_id: int
+    area_name: str
+
+
+def _fromstring(xml_content: Union[str, bytes]):
+    """
+    Parse a complete XML document, using lxml for raw bodies when available.
+
+    lxml rejects str input carrying an encoding declaration, so decoded text
+    always goes through the standard library parser. Both backends expose the
+    same find/findall/text API used below.
+
+    Args:
+        xml_content: XML document as raw bytes or decoded text
+
+    Returns:
+        Root element
+    """
+    if _LXML_PARSER is not None and isinstance(xml_content, bytes):
+        return _lxml_etree.fromstring(xml_content, _LXML_PARSER)
+    return ET.fromstring(xml_content)
+
 
 def parse_gsm_block(si: str, marker_pos: int) -> Optional[Dict[str, Any]]:
     """
@@ -149,10 +209,9 @@ def parse_datetime(cd_hex: str) -> Optional[datetime.datetime]:
             # Create timezone-aware datetime using local timezone
             dt = datetime.datetime(year, mm, gg, hh, min, ss)
             # Add local timezone for HA
-            import time as time_module
-            tz_offset = datetime.timedelta(seconds=-time_module.timezone)
-            if time_module.daylight:
-                tz_offset = datetime.timedelta(seconds=-time_module.altzone)
+            tz_offset = datetime.timedelta(seconds=-time.timezone)
+            if time.daylight:
+                tz_offset = datetime.timedelta(seconds=-time.altzone)
             dt = dt.replace(tzinfo=datetime.timezone(tz_offset))
             return dt
         except ValueError as e:
@@ -166,10 +225,13 @@ def parse_datetime(cd_hex: str) -> Optional[datetime.datetime]:
 class CombivoxXMLParser:
     """Parser for Combivox Amica XML."""
 
+    # XML backend for raw status, numTrouble, numMemProg and labelMem bodies ("lxml" or "xml.etree")
+    parser_backend = PARSER_BACKEND
+
     @staticmethod
     def parse_status_xml(
-        xml_content: str,
-        zones_config: List[Dict[str, Any]] = None,
+        xml_content: Union[str, bytes],
+        zones_config: List[CombivoxZone] = None,
         max_aree: int = 8,
         zone_ids: List[int] = None
     ) -> Dict[str, Any]:
@@ -193,7 +255,7 @@ class CombivoxXMLParser:
 
         Args:
             xml_content: Status XML content
-            zones_config: List of zone config with zone_id, zone_name, areas
+            zones_config: List of configured zones
             max_aree: Maximum number of areas (detected from labelAree.xml)
             zone_ids: List of active zone IDs (from numZoneProg.xml), if None uses zones_config
 
@@ -207,7 +269,7 @@ class CombivoxXMLParser:
                 - areas: dict {area_id: {"status": "armed"|"disarmed"}}
         """
         try:
-            root = ET.fromstring(xml_content)
+            root = _fromstring(xml_content)
 
             # Parse <cd> field (date/time)
             cd = root.find('cd')
@@ -346,10 +408,7 @@ class CombivoxXMLParser:
                 status_int = int(status_hex, 16)
 
             # Determine which areas are armed (bitwise, dynamic based on model)
-            armed_areas = []
-            for i in range(max_aree):
-                if status_int & (1 << i):
-                    armed_areas.append(i + 1)
+            armed_areas = [i + 1 for i in range(max_aree) if (status_int >> i) & 1]
 
             # Build areas dict
             areas = {}
@@ -379,14 +438,6 @@ class CombivoxXMLParser:
             _LOGGER.debug("Zone parsing: marker_pos=%d, start_z=%d, inclusion_start=%d, alarm_memory_start=%d, alarm_memory_end=%d",
                          marker_pos, start_z, inclusion_start, alarm_memory_start, alarm_memory_end)
 
-            # Create zone -> areas mapping from configuration
-            zone_to_areas = {}
-            if zones_config:
-                for zone_cfg in zones_config:
-                    zid = zone_cfg.get("zone_id")
-                    zone_areas = zone_cfg.get("areas", [])
-                    zone_to_areas[zid] = zone_areas
-
             # Parse all configured zones (supports 64/128/320 models)
             # Use zone_ids from numZoneProg.xml or extract from zones_config
             if zone_ids:
@@ -394,7 +445,7 @@ class CombivoxXMLParser:
                 pass
             elif zones_config:
                 # Extract zone_ids from configuration
-                zone_ids = [zc.get("zone_id") for zc in zones_config]
+                zone_ids = [zc.zone_id for zc in zones_config]
             else:
                 # Fallback: calculate max zones based on XML length
                 max_zones = min(199, (len(si) - start_z) // 2)  # MAX_ZONE from Costanti_Amica64.cs
@@ -455,12 +506,8 @@ class CombivoxXMLParser:
             if zones_with_alarm:
                 zone_names = []
                 if zones_config:
-                    for zid in zones_with_alarm:
-                        zone = next((z for z in zones_config if z["zone_id"] == zid), None)
-                        if zone:
-                            zone_names.append(zone.get("zone_name", f"Zone {zid}"))
-                        else:
-                            zone_names.append(f"Zone {zid}")
+                    names = {z.zone_id: z.zone_name for z in zones_config}
+                    zone_names = [names.get(zid, f"Zone {zid}") for zid in zones_with_alarm]
                 _LOGGER.debug("Alarm memory: zones %s - %s", zones_with_alarm, zone_names)
 
             # Parse command switch states from end of string
@@ -526,9 +573,6 @@ class CombivoxXMLParser:
                     _LOGGER.debug("Domotic modules hex (128 chars): %s", domotic_states_hex)
                     _LOGGER.debug("Domotic modules position: %d to %d (section len=%d)", pos_start, pos_end, pos_end - pos_start)
 
-                    # Import constants
-                    from .const import DOMOTIC_MODULE_HEX_TO_STATE, DOMOTIC_MODULE_FIRST_COMMAND_ID
-
                     # Track active modules for compressed logging
                     active_modules = []
 
@@ -700,7 +744,7 @@ class CombivoxXMLParser:
             return []
 
     @staticmethod
-    def parse_macro_ids(xml_content: str) -> List[int]:
+    def parse_macro_ids(xml_content: Union[str, bytes]) -> List[int]:
         """
         Parse the numMacro XML and extract macro IDs.
 
@@ -729,13 +773,16 @@ class CombivoxXMLParser:
             return []
 
     @staticmethod
-    def parse_macro_labels(xml_content: str, macro_ids: List[int]) -> List[Dict[str, Any]]:
+    def parse_macro_labels(xml_content: Union[str, bytes], macro_ids: List[int]) -> List[Dict[str, Any]]:
         """
         Parse the macro labels response and extract macro names.
 
         The XML response has tags like <m1>, <m2>, <m3>, etc. with hex-encoded names.
         Format: <mID>HEX_NAME~number~number</mID>
 
+        The document is parsed event by event and every <mID> element is
+        cleared once consumed, so no full tree is kept around.
+
         Args:
             xml_content: XML content from macro labels request
             macro_ids: List of macro IDs
@@ -744,14 +791,16 @@ class CombivoxXMLParser:
             List of dict: [{"macro_id": 1, "macro_name": "Uscita Totale"}, ...]
         """
         try:
-            root = ET.fromstring(xml_content)
+            parser = ET.XMLPullParser(events=("end",))
+            parser.feed(xml_content)
+            parser.close()
 
             macros = []
 
             _LOGGER.debug("Starting to parse macro labels from XML...")
 
-            # Parse all m* tags (m1, m2, m3, ...)
-            for macro_tag in root.iter():
+            # Parse all m* tags (m1, m2, m3, ...) as each one is closed
+            for _, macro_tag in parser.read_events():
                 if macro_tag.tag.startswith('m') and macro_tag.tag[1:].isdigit():
                     macro_id = int(macro_tag.tag[1:])
                     _LOGGER.debug("Found tag <%s> with text: %s", macro_tag.tag,
@@ -780,7 +829,9 @@ class CombivoxXMLParser:
                         except ValueError as e:
                             _LOGGER.warning("Unable to decode macro label %d: %s (text: %s)",
                                          macro_id, e, macro_tag.text[:50])
-                            continue
+
+                # Element fully consumed: drop its text and children
+                macro_tag.clear()
 
             _LOGGER.debug("Loaded %d macros (scenarios)", len(macros))
             return macros
@@ -790,7 +841,7 @@ class CombivoxXMLParser:
             return []
 
     @staticmethod
-    def parse_command_ids(xml_content: str) -> List[int]:
+    def parse_command_ids(xml_content: Union[str, bytes]) -> List[int]:
         """
         Parse the numComandiProg XML and extract command IDs.
 
@@ -819,7 +870,7 @@ class CombivoxXMLParser:
             return []
 
     @staticmethod
-    def parse_command_labels(xml_content: str, command_ids: List[int]) -> List[Dict[str, Any]]:
+    def parse_command_labels(xml_content: Union[str, bytes], command_ids: List[int]) -> List[Dict[str, Any]]:
         """
         Parse the command labels response and extract command names and types.
 
@@ -898,7 +949,66 @@ class CombivoxXMLParser:
             return []
 
     @staticmethod
-    def parse_prog_state_labels(xml_content: str) -> Dict[str, List[Dict[str, Any]]]:
+    def parse_c0_text(xml_content: Union[str, bytes]) -> Optional[str]:
+        """
+        Extract the <c0> value of a single-value response (numTrouble.xml, numMemProg.xml).
+
+        Raw bodies are matched directly; the XML parser only runs when that misses.
+
+        Args:
+            xml_content: Raw XML response
+
+        Returns:
+            Stripped <c0> text, or None if the element is missing or empty
+
+        Raises:
+            ParseError: If the response is not well-formed XML
+        """
+        if isinstance(xml_content, bytes):
+            match = _C0_RE.search(xml_content)
+            if match:
+                return match.group(1).decode("ascii", errors="replace")
+
+        c0_elem = _fromstring(xml_content).find("c0")
+        if c0_elem is None or not c0_elem.text:
+            return None
+        return c0_elem.text.strip()
+
+    @staticmethod
+    def parse_alarm_memory_hex(xml_content: Union[str, bytes], memory_id: str) -> Optional[str]:
+        """
+        Extract the hex-encoded label of an alarm memory entry from labelMem.xml.
+
+        Raw bodies are sliced between the <mID> tags; the XML parser only runs when
+        the tags are missing or the value is not plain text.
+
+        Args:
+            xml_content: Raw XML response
+            memory_id: Alarm memory ID (the <mID> tag suffix)
+
+        Returns:
+            Stripped hex text of <mID>, or None if the element is missing or empty
+
+        Raises:
+            ParseError: If the response is not well-formed XML
+        """
+        if isinstance(xml_content, bytes):
+            open_tag = f"<m{memory_id}>".encode("ascii")
+            start = xml_content.find(open_tag)
+            if start >= 0:
+                start += len(open_tag)
+                end = xml_content.find(f"</m{memory_id}>".encode("ascii"), start)
+                value = xml_content[start:end].strip() if end >= 0 else b""
+                if value and b"<" not in value and b"&" not in value:
+                    return value.decode("ascii", errors="replace")
+
+        mem_tag = _fromstring(xml_content).find(f"m{memory_id}")
+        if mem_tag is None or not mem_tag.text:
+            return None
+        return mem_tag.text.strip()
+
+    @staticmethod
+    def parse_prog_state_labels(xml_content: str) -> Dict[str, Any]:
         """
         Parse the labelProgStato XML and extract zone and area names.
 
@@ -915,58 +1025,128 @@ class CombivoxXMLParser:
             xml_content: XML content from labelProgStato.xml
 
         Returns:
-            Dict with two keys:
+            Dict with four keys:
             {
-                "areas": [{"area_id": 1, "area_name": "Casa Mamma"}, ...],
-                "zones": [{"zone_id": 1, "zone_name": "Portoncino"}, ...]
+                "areas": [CombivoxArea(area_id=1, area_name="Casa Mamma"), ...],
+                "zones": [CombivoxZone(zone_id=1, zone_name="Portoncino"), ...],
+                "area_name_map": {1: "Casa Mamma", ...},
+                "zone_ids": [1, ...]
             }
         """
         try:
-            root = ET.fromstring(xml_content)
-
             areas = []
             zones = []
 
-            # Parse areas (a1, a2, a3, ...)
-            # NOTE: Use iter to find all 'a*' tags, don't stop at first None
-            for area_tag in root.iter():
-                if area_tag.tag.startswith('a') and area_tag.tag[1:].isdigit():
-                    area_id = int(area_tag.tag[1:])
-                    if area_tag.text and area_tag.text.strip():
-                        try:
-                            name = bytes.fromhex(area_tag.text.strip()).decode('utf-8')
-                            if name.strip():  # Only if name is not empty (filter out unconfigured areas)
-                                areas.append({
-                                    "area_id": area_id,
-                                    "area_name": name
-                                })
-                        except ValueError:
-                            _LOGGER.warning("Unable to decode area hex %d", area_id)
-
-            # Parse zones (z1, z2, z3, ...)
-            # NOTE: Use iter to find all 'z*' tags, don't stop at first None
-            for zone_tag in root.iter():
-                if zone_tag.tag.startswith('z') and zone_tag.tag[1:].isdigit():
-                    zone_id = int(zone_tag.tag[1:])
-                    if zone_tag.text and zone_tag.text.strip():
-                        try:
-                            name = bytes.fromhex(zone_tag.text.strip()).decode('utf-8')
-                            if name.strip():  # Only if name is not empty
-                                zones.append({
-                                    "zone_id": zone_id,
-                                    "zone_name": name
-                                })
-                        except ValueError:
-                            _LOGGER.warning("Unable to decode zone hex %d", zone_id)
-
-            _LOGGER.info("Parsing labelProgStato.xml: %d areas, %d zones found",
-                       len(areas), len(zones))
+            # Single streaming pass over <aN>/<zN> tags, freeing each element
+            # once read instead of walking a full tree twice
+            parser = ET.XMLPullParser(events=("end",))
+            parser.feed(xml_content)
+            parser.close()
+            for key, record in CombivoxXMLParser._iter_prog_state_labels(parser):
+                (areas if key == "areas" else zones).append(record)
 
-            return {
-                "areas": areas,
-                "zones": zones
-            }
+            return CombivoxXMLParser._prog_state_result(areas, zones)
 
         except Exception as e:
             _LOGGER.error("Error parsing labelProgStato.xml: %s", e)
-            return {"areas": [], "zones": []}
+            return CombivoxXMLParser._prog_state_result([], [])
+
+    @staticmethod
+    async def parse_prog_state_stream(content: aiohttp.StreamReader) -> Dict[str, Any]:
+        """
+        Parse labelProgStato.xml straight from the HTTP body, chunk by chunk.
+
+        Same result as parse_prog_state_labels(), without buffering the whole
+        body as bytes and str before parsing.
+
+        Args:
+            content: Response body stream (response.content)
+
+        Returns:
+            Same dict as parse_prog_state_labels()
+        """
+        areas: List[CombivoxArea] = []
+        zones: List[CombivoxZone] = []
+        try:
+            async for key, record in CombivoxXMLParser.iter_prog_state_stream(content):
+                (areas if key == "areas" else zones).append(record)
+
+            return CombivoxXMLParser._prog_state_result(areas, zones)
+
+        except ET.ParseError as e:
+            _LOGGER.error("Error parsing labelProgStato.xml: %s", e)
+            return CombivoxXMLParser._prog_state_result([], [])
+
+    @staticmethod
+    async def iter_prog_state_stream(
+        content: aiohttp.StreamReader
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield labelProgStato.xml records as the HTTP body streams in.
+
+        Download, XML parsing and record building run as one pipeline: only the
+        current chunk and the records not yet consumed are held in memory.
+
+        Args:
+            content: Response body stream (response.content)
+
+        Yields:
+            ("areas", CombivoxArea) or ("zones", CombivoxZone)
+
+        Raises:
+            ET.ParseError: If the body is not well-formed XML
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        async for chunk in content.iter_chunked(_STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+            for item in CombivoxXMLParser._iter_prog_state_labels(parser):
+                yield item
+        parser.close()
+        for item in CombivoxXMLParser._iter_prog_state_labels(parser):
+            yield item
+
+    @staticmethod
+    def _prog_state_result(
+        areas: List[CombivoxArea],
+        zones: List[CombivoxZone]
+    ) -> Dict[str, Any]:
+        """Build the labelProgStato result, with the area name map and zone IDs derived once here."""
+        _LOGGER.info("Parsing labelProgStato.xml: %d areas, %d zones found",
+                   len(areas), len(zones))
+
+        return {
+            "areas": areas,
+            "zones": zones,
+            "area_name_map": {area.area_id: area.area_name for area in areas},
+            "zone_ids": [zone.zone_id for zone in zones]
+        }
+
+    @staticmethod
+    def _iter_prog_state_labels(parser: ET.XMLPullParser) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield records for the pending labelProgStato.xml events, freeing each element.
+
+        Args:
+            parser: Pull parser already fed with (part of) the XML
+
+        Yields:
+            ("areas", CombivoxArea) or ("zones", CombivoxZone)
+        """
+        for _, elem in parser.read_events():
+            tag = elem.tag
+            kind = tag[:1]
+            # a1, a2, ... = areas; z1, z2, ... = zones (empty tag = not configured)
+            if kind in ("a", "z") and tag[1:].isdigit() and elem.text and elem.text.strip():
+                item_id = int(tag[1:])
+                try:
+                    name = bytes.fromhex(elem.text.strip()).decode('utf-8')
+                except ValueError:
+                    _LOGGER.warning("Unable to decode %s hex %d", "area" if kind == "a" else "zone", item_id)
+                else:
+                    # Only if name is not empty (filter out unconfigured areas/zones)
+                    if name.strip():
+                        if kind == "a":
+                            yield "areas", CombivoxArea(item_id, name)
+                        else:
+                            yield "zones", CombivoxZone(item_id, name)
+            elem.clear()